@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Character frequency counting at scale.
+Files are memory-mapped and split into chunks that a process pool counts
+independently before the per-chunk counts are merged. Pure-ASCII chunks
+take a vectorized byte-histogram fast path, and the most frequent entries
+come from a heap, so the full count table is never sorted.
+
+Run As : python char_frequency.py --size-mb 1024 --workers 4
+"""
+
+import argparse
+import codecs
+import heapq
+import mmap
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+try:
+    import numpy as np  # optional, speeds up the byte histogram
+except ImportError:
+    np = None
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+# -------------------------------
+# 1. Counting in memory
+# -------------------------------
+def count_text(text):
+    """Character counts for a string (Counter counts in C, no branching)."""
+    return Counter(text)
+
+
+def byte_histogram(data):
+    """Counts of each byte value 0-255 in a bytes-like object, as a list."""
+    if np is not None:
+        return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256).tolist()
+    histogram = [0] * 256
+    for byte, count in Counter(bytes(data)).items():
+        histogram[byte] = count
+    return histogram
+
+
+def top_k(counts, k=1):
+    """The `k` most frequent (item, count) pairs, via a heap instead of a sort."""
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
+# -------------------------------
+# 2. Counting files with mmap and a process pool
+# -------------------------------
+def _chunk_bounds(mm, size, chunk_size):
+    """Split [0, size) into chunks that never cut a UTF-8 character in half."""
+    bounds = []
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        while end < size and mm[end] & 0xC0 == 0x80:  # continuation byte
+            end += 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _count_chunk(path, start, end, errors):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        chunk = mm[start:end]
+    if chunk.isascii():
+        histogram = byte_histogram(chunk)
+        return Counter({chr(b): n for b, n in enumerate(histogram) if n})
+    return Counter(chunk.decode("utf-8", errors))
+
+
+def count_file(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8", errors="replace"):
+    """Character counts for a whole file, counted chunk by chunk in parallel.
+
+    Each worker maps the file itself, so chunks are never pickled across
+    processes; only the small per-chunk Counters travel back to be merged.
+    Chunks are split on UTF-8 character boundaries, so only UTF-8 (and
+    ASCII) files are supported. Invalid bytes are handled per `errors`, as
+    in bytes.decode: by default each becomes U+FFFD instead of failing the
+    whole count.
+    """
+    if codecs.lookup(encoding).name != "utf-8":
+        raise ValueError(f"Only UTF-8 files can be split into chunks, not {encoding!r}")
+    size = os.path.getsize(path)
+    if size == 0:
+        return Counter()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = _chunk_bounds(mm, size, chunk_size)
+
+    total = Counter()
+    if workers == 1 or len(bounds) == 1:
+        for start, end in bounds:
+            total.update(_count_chunk(path, start, end, errors))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_count_chunk, path, start, end, errors) for start, end in bounds]
+        for future in futures:
+            total.update(future.result())
+    return total
+
+
+# -------------------------------
+# 3. Benchmark
+# -------------------------------
+def _dict_loop(text):
+    """The original repeating_character.py approach."""
+    char_frequency = {}
+    for char in text:
+        if char in char_frequency:
+            char_frequency[char] += 1
+        else:
+            char_frequency[char] = 1
+    return sorted(char_frequency.items(), key=lambda item: item[1], reverse=True)[0]
+
+
+def make_log(path, size_mb):
+    line = b"2024-01-01 12:00:00 INFO request handled in 12ms user=alice status=200\n"
+    block = line * (1024 * 1024 // len(line) + 1)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block[:1024 * 1024])
+
+
+def benchmark(size_mb=1024, workers=None, loop_cap_mb=16, path="char_bench.log"):
+    """MB/s of the original dict loop vs count_file on one and many workers.
+
+    The dict loop is timed on at most `loop_cap_mb`, since its rate does not
+    depend on the file size.
+    """
+    workers = workers or os.cpu_count() or 1
+    make_log(path, size_mb)
+    try:
+        print(f"\n--- Character Frequency Benchmark ({size_mb} MB, numpy={np is not None}) ---")
+        loop_mb = min(size_mb, loop_cap_mb)
+        with open(path, "r") as f:
+            text = f.read(loop_mb * 1024 * 1024)
+        start = time.perf_counter()
+        _dict_loop(text)
+        print(f"{'dict loop + sort':<22} {loop_mb / (time.perf_counter() - start):>10.1f} MB/s")
+        del text
+
+        for n in sorted({1, workers}):
+            start = time.perf_counter()
+            counts = count_file(path, workers=n)
+            elapsed = time.perf_counter() - start
+            print(f"{f'mmap, {n} workers':<22} {size_mb / elapsed:>10.1f} MB/s  top: {top_k(counts, 1)}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    benchmark(args.size_mb, args.workers)
@@ -1,14 +1,10 @@
 # Find the most reppeating charachter in a string
 from pprint import pp
-sentence = "This is a common interview question"
-
-char_frequency = {}
+from char_frequency import count_text, top_k
 
-for char in sentence:
-    if char in char_frequency:
-        char_frequency[char] += 1
-    else:
-        char_frequency[char] = 1
+sentence = "This is a common interview question"
 
-char_frequency = sorted(char_frequency.items(), key=lambda item: item[1], reverse=True)
-pp(char_frequency)
\ No newline at end of file
+# Counter does the counting in C; a heap finds the top entries without
+# sorting every (char, count) pair
+char_frequency = count_text(sentence)
+pp(top_k(char_frequency, 3))
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from timeit import timeit
+import os
+import sys
 from collections import defaultdict
 
 
@@ -95,13 +96,42 @@ def demo_context_manager():
 # --------------------------------
 # 6. Performance: Try-Except vs If-Check
 # --------------------------------
+def parse_with_try_except(s="abc"):
+    try:
+        return int(s)
+    except ValueError:
+        return None
+
+
+def parse_with_if_check(s="abc"):
+    if s.isdigit():
+        return int(s)
+    return None
+
+
+def register_benchmarks(suite):
+    """Hook for the shared harness in standard-library/microbench.py."""
+    suite.add("exceptions.try_except", parse_with_try_except)
+    suite.add("exceptions.if_check", parse_with_if_check)
+
+
+def _load_microbench():
+    harness_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "standard-library")
+    if harness_dir not in sys.path:
+        sys.path.append(harness_dir)
+    import microbench
+    return microbench
+
+
 def demo_performance_comparison():
     print("=== Exception vs If Performance ===")
-    try_time = timeit('try:\n int("abc")\nexcept:\n pass', number=10000)
-    if_time = timeit('s = "abc"\nif s.isdigit():\n int(s)', number=10000)
+    microbench = _load_microbench()
+    suite = microbench.Suite()
+    register_benchmarks(suite)
+    results = suite.run(repeat=5, min_time=0.05)
 
-    print("Try-Except time:", try_time)
-    print("If-Check time:  ", if_time)
+    try_time = results["exceptions.try_except"]["median"]
+    if_time = results["exceptions.if_check"]["median"]
     print("Try/Except is ~{:.1f}x slower".format(try_time / if_time))
     print()
 
@@ -0,0 +1,233 @@
+"""
+A TagCloud that many producer threads can add to at once.
+
+Counts are split across shards by tag hash, each shard a dict with its own
+lock, so threads only contend when they drain into the same shard. add()
+takes no lock at all: each producer thread appends raw tags to its own
+deque (an atomic operation), and once `flush_size` tags are queued it pops
+them, counts and normalizes them in bulk, and adds the totals to the
+shards, taking each shard lock once per batch instead of once per tag.
+
+Every buffer is registered with the cloud, so readers never miss counts:
+snapshot() (and every other read) first drains all buffers, including those
+of threads that have exited without calling flush(), then takes every shard
+lock (always in the same order) to return one point-in-time copy. A drain
+holds its buffer's lock until its counts are in the shards, so a reader
+also waits for a drain another thread has started.
+"""
+
+import heapq
+import sys
+import threading
+import time
+from collections import Counter, deque
+from operator import itemgetter
+
+from tag_counters import normalize_tag
+
+
+class _Buffer:
+    """One producer thread's queued tags; drainers pop from the other end."""
+
+    __slots__ = ("tags", "lock", "thread")
+
+    def __init__(self):
+        self.tags = deque()  # raw tags: append and popleft are atomic, so adding needs no lock
+        self.lock = threading.Lock()  # one drainer at a time, held until its counts are applied
+        self.thread = threading.current_thread()
+
+
+class ConcurrentTagCloud:
+    def __init__(self, shards=16, flush_size=10_000):
+        self.flush_size = flush_size
+        self.__shards = [{} for _ in range(shards)]
+        self.__locks = [threading.Lock() for _ in range(shards)]
+        self.__local = threading.local()
+        self.__buffers = []
+        self.__buffers_lock = threading.Lock()
+
+    def __shard(self, tag):
+        return hash(tag) % len(self.__shards)
+
+    def __buffer(self):
+        try:
+            return self.__local.buffer
+        except AttributeError:
+            buffer = self.__local.buffer = _Buffer()
+            with self.__buffers_lock:
+                self.__buffers.append(buffer)
+            return buffer
+
+    # --- Producers ---
+    def add(self, tag):  # the hot path: no lock, no normalization
+        try:
+            tags = self.__local.buffer.tags
+        except AttributeError:
+            tags = self.__buffer().tags
+        tags.append(tag)
+        if len(tags) >= self.flush_size:
+            self.flush()
+
+    def add_many(self, tags):
+        """Add a batch; it is already one batch, so it goes straight to the shards."""
+        counts = Counter(tags)  # counted raw, so each distinct tag is normalized once
+        self.__apply(counts)
+
+    def flush(self):
+        """Merge this thread's buffered counts into the shards now."""
+        self.__drain(self.__buffer())
+
+    def __drain(self, buffer):
+        with buffer.lock:
+            tags = buffer.tags
+            popleft = tags.popleft  # tags appended meanwhile stay queued for the next drain
+            self.__apply(Counter([popleft() for _ in range(len(tags))]))
+
+    def __apply(self, raw_counts):
+        """Normalize `raw_counts` and add them to the shards, one lock per shard."""
+        by_shard = {}
+        for tag, n in raw_counts.items():
+            tag = normalize_tag(tag)
+            by_shard.setdefault(self.__shard(tag), []).append((tag, n))
+        for index, items in by_shard.items():
+            shard = self.__shards[index]
+            with self.__locks[index]:
+                for tag, n in items:
+                    shard[tag] = shard.get(tag, 0) + n
+
+    def drain(self):
+        """Merge every producer's buffered counts into the shards."""
+        with self.__buffers_lock:
+            buffers = list(self.__buffers)
+        for buffer in buffers:
+            self.__drain(buffer)
+        with self.__buffers_lock:  # threads that are gone will never add again
+            self.__buffers = [b for b in self.__buffers if b.thread.is_alive() or b.tags]
+
+    # --- Readers ---
+    def snapshot(self):
+        """A consistent copy of all counts as a plain dict."""
+        self.drain()
+        for lock in self.__locks:
+            lock.acquire()
+        try:
+            merged = {}
+            for shard in self.__shards:
+                merged.update(shard)  # shards hold disjoint tags
+            return merged
+        finally:
+            for lock in reversed(self.__locks):
+                lock.release()
+
+    def merge(self, counts):
+        """Add another mapping of tag -> count (e.g. a snapshot) into this cloud."""
+        for tag, n in counts.items():
+            tag = normalize_tag(tag)
+            index = self.__shard(tag)
+            with self.__locks[index]:
+                shard = self.__shards[index]
+                shard[tag] = shard.get(tag, 0) + n
+
+    def most_common(self, k=10):
+        return heapq.nlargest(k, self.snapshot().items(), key=itemgetter(1))
+
+    def __getitem__(self, tag):
+        self.drain()
+        tag = normalize_tag(tag)
+        index = self.__shard(tag)
+        with self.__locks[index]:
+            return self.__shards[index].get(tag, 0)
+
+    def __setitem__(self, tag, count):
+        tag = normalize_tag(tag)
+        if count <= 0:
+            raise ValueError("Count must be positive")
+        self.drain()  # so buffered increments don't land on top of the new count
+        index = self.__shard(tag)
+        with self.__locks[index]:
+            self.__shards[index][tag] = count
+
+    def __len__(self):
+        return len(self.snapshot())
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+
+class LockedTagCloud:
+    """Baseline for the benchmark: one global lock around a plain dict."""
+
+    def __init__(self):
+        self.__tags = {}
+        self.__lock = threading.Lock()
+
+    def add(self, tag):
+        tag = normalize_tag(tag)
+        with self.__lock:
+            self.__tags[tag] = self.__tags.get(tag, 0) + 1
+
+    def flush(self):
+        pass
+
+    def snapshot(self):
+        with self.__lock:
+            return dict(self.__tags)
+
+
+# --- Correctness check and benchmark ---
+def _produce(cloud, tags, barrier):
+    barrier.wait()
+    for tag in tags:
+        cloud.add(tag)  # no flush(): readers must still see every increment
+
+
+def run_producers(cloud, threads, per_thread, distinct=1_000):
+    """Start `threads` producers adding `per_thread` tags each; return seconds."""
+    tags = [f"Tag{i % distinct}" for i in range(per_thread)]
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=_produce, args=(cloud, tags, barrier)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def check_no_lost_increments(threads=8, per_thread=100_000, distinct=1_000):
+    """Assert every increment from every producer thread is counted."""
+    cloud = ConcurrentTagCloud(flush_size=256)
+    run_producers(cloud, threads, per_thread, distinct)
+    counts = cloud.snapshot()
+    assert sum(counts.values()) == threads * per_thread, "lost increments"
+    assert counts["tag0"] == threads * (per_thread // distinct + (per_thread % distinct > 0))
+
+    hot = ConcurrentTagCloud(flush_size=256)
+    run_producers(hot, threads, per_thread, distinct=1)  # one tag: flushes count increments
+    assert hot["tag0"] == threads * per_thread, "lost increments of a hot tag"
+    print(f"No lost increments: {threads} threads x {per_thread:,} adds")
+
+
+def benchmark(per_thread=200_000, thread_counts=(1, 2, 4, 8, 16, 32)):
+    """adds/sec of the global-lock baseline vs ConcurrentTagCloud.
+
+    The win comes from draining: a batch of flush_size tags drawn from 1,000
+    distinct ones is counted, normalized and locked once per distinct tag.
+    With no repeats within a batch the two run about even, since under the
+    GIL an uncontended lock costs little and the threads never run at once.
+    """
+    print(f"\n--- Concurrent TagCloud Benchmark ({per_thread:,} adds per thread) ---")
+    print(f"{'threads':>8} {'global lock adds/sec':>22} {'sharded adds/sec':>18}")
+    for threads in thread_counts:
+        rates = []
+        for cloud in (LockedTagCloud(), ConcurrentTagCloud()):
+            elapsed = run_producers(cloud, threads, per_thread)
+            assert sum(cloud.snapshot().values()) == threads * per_thread
+            rates.append(threads * per_thread / elapsed)
+        print(f"{threads:>8} {rates[0]:>22,.0f} {rates[1]:>18,.0f}")
+
+
+if __name__ == "__main__":
+    check_no_lost_increments()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
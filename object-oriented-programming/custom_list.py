@@ -0,0 +1,193 @@
+"""
+CustomList: a typed, array-backed sequence whose slices are views.
+
+The values live in one array of a single C type (`typecode`, as in the
+array module), so there is no Python object per element. Slicing returns a
+CustomList that shares that memory instead of copying it: writes through a
+slice show up in the original. view() (and memoryview(lst) on Python 3.12+)
+exports the storage through the buffer protocol, and extend() copies from
+any buffer of the same layout (e.g. a NumPy int64 array into typecode "q")
+with a single memcpy.
+
+Like bytearray, a CustomList cannot grow while views of it exist: extend()
+and append() raise BufferError until the views are released. Extending a
+list with a slice of itself, as in lst.extend(lst[1:]), works as long as
+that slice is the only view; the slice keeps viewing the list afterwards.
+
+Run As : python custom_list.py --elements 100000000
+"""
+
+import argparse
+import struct
+import sys
+import time
+from array import array
+from collections.abc import MutableSequence
+
+
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+def _kind(code):
+    if code in "fd":
+        return "float"
+    return "unsigned" if code in "BHILQN" else "signed" if code in "bhilqn" else None
+
+
+def _same_layout(fmt, typecode):
+    """Whether buffer format `fmt` stores items exactly like array(typecode).
+
+    Formats are compared by item size and kind, so NumPy's "l" matches "q"
+    on 64-bit Linux, and "<q" or "=q" match too on little-endian machines.
+    """
+    code = fmt.lstrip("@=" + _NATIVE_ORDER)
+    if len(code) != 1 or _kind(code) is None:
+        return False
+    return _kind(code) == _kind(typecode) and struct.calcsize(fmt) == array(typecode).itemsize
+
+
+def _as_slice(indices):
+    """The slice selecting `indices` (a range) from its owner."""
+    return slice(indices.start, indices.stop if indices.stop >= 0 else None, indices.step)
+
+
+class CustomList(MutableSequence):
+    __slots__ = ("_data", "_range")
+
+    def __init__(self, data=(), typecode="q"):
+        # an array when this list owns its storage, a memoryview for a slice
+        self._data = data if isinstance(data, memoryview) else array(typecode, data)
+        self._range = None  # for a slice: the owner's indices it views
+
+    @property
+    def typecode(self):
+        data = self._data
+        return data.typecode if isinstance(data, array) else data.format
+
+    # --- Buffer export ---
+    def view(self):
+        return memoryview(self._data)
+
+    def __buffer__(self, flags):  # Python 3.12+: memoryview(lst), bytes(lst), ...
+        return memoryview(self._data)
+
+    # --- Sequence protocol ---
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = CustomList(memoryview(self._data)[index])  # a view, not a copy
+            view._range = (self._range or range(len(self._data)))[index]
+            return view
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):  # both arrays and memoryviews accept a same-typed array
+            value = array(self.typecode, value.view() if isinstance(value, CustomList) else value)
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        if not isinstance(self._data, array):
+            raise TypeError("A slice of a CustomList has a fixed size")
+        del self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, CustomList):
+            other = other._data
+        return self._data == other if isinstance(other, (array, memoryview)) else list(self) == other
+
+    def __repr__(self):
+        return f"CustomList({self.tolist()!r}, typecode={self.typecode!r})"
+
+    def tolist(self):
+        return self._data.tolist()
+
+    # --- Growing (owners only) ---
+    def _owned(self):
+        if not isinstance(self._data, array):
+            raise TypeError("A slice of a CustomList has a fixed size")
+        return self._data
+
+    def insert(self, index, value):
+        self._owned().insert(index, value)
+
+    def append(self, value):
+        self._owned().append(value)
+
+    def extend(self, values):
+        """Append `values`; buffers of the same type are copied in one memcpy."""
+        data = self._owned()
+        if values is self:
+            data.extend(data)
+            return
+        if isinstance(values, CustomList) and values._range is not None and values._data.obj is data:
+            self._extend_from_own_slice(values)
+            return
+        if isinstance(values, CustomList):
+            values = values.view()
+        try:
+            source = memoryview(values)
+        except TypeError:  # not a buffer
+            data.extend(values)
+            return
+        with source:
+            if not _same_layout(source.format, data.typecode):
+                data.extend(source)  # converts element by element
+            elif source.c_contiguous:
+                data.frombytes(source.cast("B"))
+            else:
+                data.frombytes(source.tobytes())  # a strided slice, gathered in C
+
+    def _extend_from_own_slice(self, view):
+        # the slice's memoryview pins our array, so copy the values out, let
+        # go of it for the resize and re-create it over the same indices.
+        # Any other view still pins the array and the resize raises BufferError.
+        data = self._data
+        values = view._data.tobytes()
+        view._data.release()  # BufferError if the slice has views of its own
+        try:
+            data.frombytes(values)
+        finally:
+            view._data = memoryview(data)[_as_slice(view._range)]
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+
+# --- Benchmark ---
+def _seconds(func):
+    start = time.perf_counter()
+    func()  # the result (possibly a view) is dropped right away
+    return time.perf_counter() - start
+
+
+def benchmark(n=100_000_000):
+    """Slicing, iteration and extend over `n` elements: list vs CustomList."""
+    print(f"\n--- CustomList Benchmark ({n:,} int64 elements) ---")
+    print(f"{'operation':<28} {'list s':>10} {'CustomList s':>14}")
+    plain = list(range(n))
+    typed = CustomList(range(n))
+    rows = [
+        ("slice [n//4 : 3n//4]", lambda: plain[n // 4: 3 * n // 4], lambda: typed[n // 4: 3 * n // 4]),
+        ("slice [::2]", lambda: plain[::2], lambda: typed[::2]),
+        ("sum(all)", lambda: sum(plain), lambda: sum(typed)),
+        ("sum(slice [::2])", lambda: sum(plain[::2]), lambda: sum(typed[::2])),
+    ]
+    for label, on_list, on_custom in rows:
+        print(f"{label:<28} {_seconds(on_list):>10.4f} {_seconds(on_custom):>14.4f}")
+
+    half = array("q", range(n // 2))
+    list_s = _seconds(lambda: plain.extend(half))
+    custom_s = _seconds(lambda: typed.extend(half))  # no views of `typed` are alive here
+    print(f"{'extend from array (n/2)':<28} {list_s:>10.4f} {custom_s:>14.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--elements", type=int, default=100_000_000)
+    benchmark(parser.parse_args().elements)
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 from abc import ABC, abstractmethod
+from array import array
 from collections import namedtuple
 from dataclasses import dataclass
 
+from custom_list import CustomList
+from observable_list import TrackableList
+from records import RecordBatch, make_record
+
 # ---------------------------------------
 # Classes, Instances, and Constructors
 # ---------------------------------------
@@ -60,18 +65,15 @@ print(p.x, p.y)
 # ---------------------------------------
 # Magic Methods (custom container)
 # ---------------------------------------
-class CustomList:
-    def __init__(self, data):
-        self.data = data
-
-    def __getitem__(self, index):
-        return self.data[index]
-
-    def __len__(self):
-        return len(self.data)
-
+# CustomList (custom_list.py) implements __getitem__, __setitem__, __len__, ...
+# over a typed array; slicing returns a view that shares its memory
 mylist = CustomList([1, 2, 3])
 print(mylist[1], len(mylist))
+tail = mylist[1:]
+tail[0] = 20  # writes through to mylist
+print(mylist, tail.view().nbytes)  # 2 int64 values: 16 bytes
+del tail  # release the view so mylist can grow again
+mylist.extend(array("q", [4, 5]))  # copied buffer to buffer
 
 # ---------------------------------------
 # Inheritance and Method Overriding
@@ -151,13 +153,14 @@ make_speak(Cat())
 # ---------------------------------------
 # Extending Built-in Types
 # ---------------------------------------
-class TrackableList(list):
-    def append(self, item):
-        print(f"Appending {item}")
-        super().append(item)
-
-lst = TrackableList()
+# TrackableList (observable_list.py) overrides every mutating list method
+# and hands the changes to subscribers in batches
+lst = TrackableList(flush_size=2)
+lst.subscribe(lambda changes: print("Changes:", changes))
 lst.append(5)
+lst += [6, 7]  # second change: the batch is delivered
+lst.insert(0, 4)
+lst.flush()
 print(lst)
 
 # ---------------------------------------
@@ -175,4 +178,11 @@ print(dp1 == dp2)  # True, checks for equality by data
 # namedtuple for immutable data bundles
 PointTuple = namedtuple("PointTuple", ["x", "y"])
 pt1 = PointTuple(10, 20)
-print(pt1.x, pt1.y)
\ No newline at end of file
+print(pt1.x, pt1.y)
+
+# Many records: slotted/frozen classes and columnar batches (see records.py)
+FrozenPoint = make_record("FrozenPoint", ["x", "y"])  # __slots__, no per-instance __dict__
+print(FrozenPoint(1, 2) == FrozenPoint(1, 2), hash(FrozenPoint(1, 2)))
+
+batch = RecordBatch.from_rows({"x": "q", "y": "q"}, [pt1, PointTuple(30, 40)], record=PointTuple)
+print(batch[1], batch.column("x").tolist(), batch.nbytes)  # 16 bytes per record
@@ -0,0 +1,227 @@
+"""
+PointArray: many 2D points stored as two contiguous columns of doubles.
+
+A list of Point objects costs a Python object (plus two float objects) per
+point, and every `+` or `==` is a method call. PointArray keeps all x values
+in one array('d') and all y values in another, and works on whole columns:
+`+` adds arrays, `equal` returns a mask, `argsort` sorts lexicographically.
+With NumPy installed the column loops run in C; without it they fall back to
+plain Python over the same arrays.
+
+Slicing returns a view (memoryviews over the same buffers), never a copy, so
+writes through a slice are visible in the original.
+
+Run As : python point_array.py --points 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from array import array
+from itertools import repeat
+from operator import add
+
+try:
+    import numpy as np  # optional, vectorizes the column operations
+except ImportError:
+    np = None
+
+
+def _column(n):
+    return memoryview(array("d", bytes(8 * n)))
+
+
+def _to_column(values):
+    return memoryview(array("d", values))
+
+
+class PointArray:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        # x and y are equal-length memoryviews of doubles
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        self.x, self.y = x, y
+
+    # --- Constructors ---
+    @classmethod
+    def zero(cls, n):
+        """`n` points at the origin."""
+        return cls(_column(n), _column(n))
+
+    @classmethod
+    def from_xy(cls, xs, ys):
+        return cls(_to_column(xs), _to_column(ys))
+
+    @classmethod
+    def from_points(cls, points):
+        """Copy any objects with .x and .y (e.g. Point instances)."""
+        points = list(points)
+        return cls(_to_column(p.x for p in points), _to_column(p.y for p in points))
+
+    # --- Sequence protocol ---
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointArray(self.x[index], self.y[index])  # a view, not a copy
+        return self.x[index], self.y[index]
+
+    def __setitem__(self, index, point):
+        x, y = point
+        self.x[index], self.y[index] = x, y
+
+    def __iter__(self):
+        return zip(self.x, self.y)
+
+    def __repr__(self):
+        preview = ", ".join(f"({x}, {y})" for x, y in zip(self.x[:3], self.y[:3]))
+        return f"PointArray([{preview}{', ...' if len(self) > 3 else ''}], n={len(self)})"
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes + self.y.nbytes
+
+    # --- Column operations ---
+    def _columns(self, other):
+        """`other`'s columns: NumPy arrays (or iterables) for a PointArray,
+        scalars (or repeats) for a single (x, y) point."""
+        if isinstance(other, PointArray):
+            if len(other) != len(self):
+                raise ValueError("PointArrays must have the same length")
+            x, y = other.x, other.y
+            return (np.asarray(x), np.asarray(y)) if np is not None else (x, y)
+        x, y = (other.x, other.y) if hasattr(other, "x") else other
+        return (x, y) if np is not None else (repeat(x), repeat(y))
+
+    def __add__(self, other):
+        try:
+            ox, oy = self._columns(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+        result = PointArray.zero(len(self))
+        if np is not None:
+            np.add(np.asarray(self.x), ox, out=np.asarray(result.x))
+            np.add(np.asarray(self.y), oy, out=np.asarray(result.y))
+        else:
+            result.x[:] = array("d", map(add, self.x, ox))
+            result.y[:] = array("d", map(add, self.y, oy))
+        return result
+
+    __radd__ = __add__
+
+    def __iadd__(self, other):
+        ox, oy = self._columns(other)
+        if np is not None:
+            xs, ys = np.asarray(self.x), np.asarray(self.y)
+            xs += ox
+            ys += oy
+        else:
+            self.x[:] = array("d", map(add, self.x, ox))
+            self.y[:] = array("d", map(add, self.y, oy))
+        return self
+
+    def equal(self, other):
+        """Element-wise ==: a NumPy bool array (or a list of bools without NumPy)."""
+        ox, oy = self._columns(other)
+        if np is not None:
+            return (np.asarray(self.x) == ox) & (np.asarray(self.y) == oy)
+        return [x == a and y == b for x, y, a, b in zip(self.x, self.y, ox, oy)]
+
+    def argsort(self):
+        """Indices that sort the points by x, then y (the order Point's > uses)."""
+        if np is not None:
+            return np.lexsort((np.asarray(self.y), np.asarray(self.x)))
+        x, y = self.x, self.y
+        return sorted(range(len(x)), key=lambda i: (x[i], y[i]))
+
+    def take(self, indices):
+        if np is not None:
+            indices = np.asarray(indices)
+            return PointArray(memoryview(np.asarray(self.x)[indices]), memoryview(np.asarray(self.y)[indices]))
+        return PointArray.from_xy([self.x[i] for i in indices], [self.y[i] for i in indices])
+
+    def sorted(self):
+        return self.take(self.argsort())
+
+    def copy(self):
+        return PointArray(_to_column(self.x), _to_column(self.y))
+
+
+# --- Benchmark ---
+class ScalarPoint:
+    """Baseline: the slotted Point from point_class-demo.py (which can't be
+    imported, the dash in its name is not a valid identifier)."""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+    def __gt__(self, other):
+        return self.x > other.x or (self.x == other.x and self.y > other.y)
+
+    def __add__(self, other):
+        return ScalarPoint(self.x + other.x, self.y + other.y)
+
+
+class DictPoint(ScalarPoint):
+    """The same Point with a per-instance __dict__ (no __slots__)."""
+
+
+def _traced_bytes(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def _rate(n, func):
+    start = time.perf_counter()
+    func()
+    return n / (time.perf_counter() - start)
+
+
+def benchmark(n=1_000_000):
+    """Bytes per point and points/sec for lists of Points vs PointArray."""
+    xs = [i % 1_000 for i in range(n)]
+    ys = [i % 997 for i in range(n)]
+    print(f"\n--- PointArray Benchmark ({n:,} points, numpy={np is not None}) ---")
+    print(f"{'storage':<22} {'bytes/point':>12} {'add/sec':>14} {'== /sec':>14} {'sort/sec':>14}")
+    for label, cls in (("list of dict Points", DictPoint), ("list of slotted Points", ScalarPoint)):
+        size = _traced_bytes(lambda: [cls(float(x), float(y)) for x, y in zip(xs, ys)])  # owns its floats
+        points = [cls(float(x), float(y)) for x, y in zip(xs, ys)]
+        shifted = [cls(x + 1.0, float(y)) for x, y in zip(xs, ys)]
+        adds = _rate(n, lambda: [p + q for p, q in zip(points, shifted)])
+        eqs = _rate(n, lambda: [p == q for p, q in zip(points, shifted)])
+        sorts = _rate(n, lambda: sorted(points, key=lambda p: (p.x, p.y)))
+        print(f"{label:<22} {size / n:>12.1f} {adds:>14,.0f} {eqs:>14,.0f} {sorts:>14,.0f}")
+        del points, shifted
+
+    size = _traced_bytes(lambda: PointArray.from_xy(xs, ys))
+    points = PointArray.from_xy(xs, ys)
+    shifted = points + (1.0, 0.0)
+    adds = _rate(n, lambda: points + shifted)
+    eqs = _rate(n, lambda: points.equal(shifted))
+    sorts = _rate(n, points.sorted)
+    print(f"{'PointArray':<22} {size / n:>12.1f} {adds:>14,.0f} {eqs:>14,.0f} {sorts:>14,.0f}")
+
+
+if __name__ == "__main__":
+    points = PointArray.from_xy([3, 1, 1], [0, 5, 2])
+    print(points, points + (1, 1), points.sorted())
+    view = points[1:]
+    view[0] = (9, 9)  # writes through to `points`
+    print(points[1], points.equal((9, 9)))
+    print(PointArray.zero(4))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=1_000_000)
+    benchmark(parser.parse_args().points)
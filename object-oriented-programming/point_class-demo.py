@@ -1,4 +1,5 @@
 class Point:
+    __slots__ = ("x", "y")  # Fixed attributes: no per-instance __dict__, less memory per point
     default_color = "red"  # Class variable
     default_size = 10      # Class variable
     
@@ -17,7 +18,7 @@ class Point:
     def __gt__(self, other):
         if not isinstance(other, Point):
             return NotImplemented
-        return (self.x, self.y) > (other.x, other.y)
+        return self.x > other.x or (self.x == other.x and self.y > other.y)  # same order as tuples, without building them
     
     def __add__(self, other):
         if not isinstance(other, Point):
@@ -55,4 +56,17 @@ print(point > origin)  # Output: True
 print(point < origin)  # Output: False  Python uses the __lt__ method to define the behavior of <
 print(point != origin)  # Output: True  Python automatically understands what != means after defining lt
 
-print(point + origin)  # Output: (1, 2)  Python automatically
\ No newline at end of file
+print(point + origin)  # Output: (1, 2)  Python automatically
+
+try:
+    point.z = 3  # __slots__ rejects attributes it does not list
+except AttributeError as ex:
+    print("AttributeError:", ex)
+
+# Many points: store them column-wise in a PointArray (see point_array.py)
+from point_array import PointArray
+
+points = PointArray.from_points([point, origin, Point(5, 1)])
+print(points + point)  # adds point to every element at once
+print(points.equal(origin))  # element-wise == mask
+print(points.sorted())  # lexicographic, like sorted() with __gt__
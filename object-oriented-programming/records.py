@@ -0,0 +1,194 @@
+"""
+Compact records: slotted record classes and columnar RecordBatch storage.
+
+A @dataclass instance carries a __dict__; a namedtuple is a tuple. Either
+way every record is a full Python object holding pointers to more objects.
+- make_record() builds a dataclass with __slots__ (frozen by default), which
+  drops the __dict__ but is still one object per record.
+- RecordBatch stores each field as one typed array, so a record of two
+  64-bit ints costs 16 bytes. Columns are exported as memoryviews without
+  copying, slices are views, == compares whole arrays in C, and pack() /
+  from_packed() convert to and from row-major struct bytes.
+
+Run As : python records.py --records 1000000
+"""
+
+import argparse
+import struct
+import time
+import tracemalloc
+from array import array
+from collections import namedtuple
+from collections.abc import Sequence
+from dataclasses import dataclass, make_dataclass
+from itertools import starmap
+
+
+def make_record(name, fields, frozen=True):
+    """A slotted (and by default frozen, hence hashable) class with `fields`."""
+    return make_dataclass(name, fields, slots=True, frozen=frozen)
+
+
+_INT_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+
+def _struct_code(typecode):
+    """The struct code with the same size as array(typecode) items on this platform."""
+    if typecode in ("f", "d"):
+        return typecode
+    if typecode in ("b", "h", "i", "l", "q"):
+        return _INT_CODES[array(typecode).itemsize]
+    if typecode in ("B", "H", "I", "L", "Q"):
+        return _INT_CODES[array(typecode).itemsize].upper()
+    raise ValueError(f"Typecode {typecode!r} cannot be packed")
+
+
+def _row_struct(fields):
+    # "<": standard sizes and no padding, with each code sized to match the column
+    return struct.Struct("<" + "".join(map(_struct_code, fields.values())))
+
+
+class RecordBatch:
+    """Records stored column by column; `fields` maps field name -> array typecode."""
+
+    def __init__(self, fields, columns=None, record=None):
+        self.fields = dict(fields)
+        self.record = record or make_record("Record", list(self.fields))
+        if columns is None:
+            columns = [array(code) for code in self.fields.values()]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All columns must have the same length")
+        self._columns = list(columns)  # arrays, or memoryviews for a slice
+
+    # --- Bulk construction ---
+    @classmethod
+    def from_rows(cls, fields, rows, record=None):
+        """Build from an iterable of tuples or other sequences (or records with matching attributes)."""
+        batch = cls(fields, record=record)
+        appends = [column.append for column in batch._columns]
+        width = len(appends)
+        for row in rows:
+            if not isinstance(row, tuple):
+                if isinstance(row, (str, bytes)):
+                    raise TypeError(f"A row must be a sequence of values or a record, not {row!r}")
+                if isinstance(row, Sequence):
+                    row = tuple(row)
+                else:
+                    row = tuple(getattr(row, name) for name in batch.fields)
+            if len(row) != width:
+                raise ValueError(f"Expected {width} values per row, got {len(row)}: {row!r}")
+            for append, value in zip(appends, row):
+                append(value)
+        return batch
+
+    @classmethod
+    def from_columns(cls, fields, columns, record=None):
+        """Build from one iterable (or buffer) of values per field."""
+        return cls(fields, [array(code, values) for code, values in zip(dict(fields).values(), columns)], record)
+
+    @classmethod
+    def from_packed(cls, fields, data, record=None):
+        """Build from row-major bytes written by pack()."""
+        fields = dict(fields)
+        columns = zip(*_row_struct(fields).iter_unpack(data)) if data else [()] * len(fields)
+        return cls.from_columns(fields, columns, record)
+
+    def pack(self):
+        """All records as row-major struct-packed bytes."""
+        return b"".join(starmap(_row_struct(self.fields).pack, zip(*self._columns)))
+
+    # --- Access ---
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordBatch(self.fields, [memoryview(c)[index] for c in self._columns], self.record)
+        return self.record(*(column[index] for column in self._columns))
+
+    def __iter__(self):
+        return starmap(self.record, zip(*self._columns))
+
+    def column(self, name):
+        """The `name` field as a memoryview over the batch's own storage."""
+        return memoryview(self._columns[list(self.fields).index(name)])
+
+    def append(self, row):
+        row = tuple(row)
+        if len(row) != len(self._columns):
+            raise ValueError(f"Expected {len(self._columns)} values per row, got {len(row)}: {row!r}")
+        for column, value in zip(self._columns, row):
+            column.append(value)
+
+    def __eq__(self, other):
+        if not isinstance(other, RecordBatch):
+            return NotImplemented
+        return self.fields == other.fields and all(
+            a == b for a, b in zip(self._columns, other._columns))
+
+    @property
+    def nbytes(self):
+        return sum(memoryview(column).nbytes for column in self._columns)
+
+    def __repr__(self):
+        return f"RecordBatch({self.fields}, n={len(self)})"
+
+
+# --- Benchmark ---
+@dataclass
+class DataPoint:  # as in main_demo.py, which runs its demo on import
+    x: int
+    y: int
+
+
+PointTuple = namedtuple("PointTuple", ["x", "y"])
+
+
+def _traced_bytes(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def benchmark(n=1_000_000):
+    """Bytes per record, construction and == rate for each record type."""
+    fields = {"x": "q", "y": "q"}
+    xs, ys = range(n), range(n, 2 * n)
+    SlotPoint = make_record("SlotPoint", ["x", "y"], frozen=False)
+    FrozenPoint = make_record("FrozenPoint", ["x", "y"])
+    builders = [
+        ("@dataclass", lambda: list(map(DataPoint, xs, ys))),
+        ("namedtuple", lambda: list(map(PointTuple, xs, ys))),
+        ("slotted dataclass", lambda: list(map(SlotPoint, xs, ys))),
+        ("frozen slotted", lambda: list(map(FrozenPoint, xs, ys))),
+        ("RecordBatch.from_rows", lambda: RecordBatch.from_rows(fields, zip(xs, ys))),
+        ("RecordBatch.from_columns", lambda: RecordBatch.from_columns(fields, [xs, ys])),
+    ]
+    print(f"\n--- Record Benchmark ({n:,} records of two ints) ---")
+    print(f"{'storage':<26} {'bytes/record':>13} {'built/sec':>14} {'== records/sec':>16}")
+    for label, build in builders:
+        untraced = time.perf_counter()
+        first, second = build(), build()
+        built = n / (time.perf_counter() - untraced) * 2
+        size = _traced_bytes(build)  # tracing slows construction, so it is timed above
+        start = time.perf_counter()
+        assert first == second
+        compared = n / (time.perf_counter() - start)
+        print(f"{label:<26} {size / n:>13.1f} {built:>14,.0f} {compared:>16,.0f}")
+        del first, second
+
+
+if __name__ == "__main__":
+    Pixel = make_record("Pixel", ["x", "y"])
+    print(Pixel(1, 2), Pixel(1, 2) == Pixel(1, 2), hash(Pixel(1, 2)) == hash(Pixel(1, 2)))
+
+    batch = RecordBatch.from_rows({"x": "q", "y": "d"}, [(1, 0.5), (2, 1.5), (3, 2.5)])
+    print(batch, batch[0], list(batch[1:]), batch.column("y").tolist())
+    print(RecordBatch.from_packed(batch.fields, batch.pack()) == batch)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=1_000_000)
+    benchmark(parser.parse_args().records)
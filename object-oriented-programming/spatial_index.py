@@ -0,0 +1,431 @@
+"""
+Spatial indexes for Point-like objects (anything with .x and .y).
+
+Finding the points near a location by scanning a list costs O(n) per query.
+Two indexes answer the same queries after one bulk load:
+- KDTree splits space at the median, alternating x and y, down to small
+  leaf buckets. Good for any distribution of points.
+- UniformGrid hashes points into square cells of `cell_size`. Cheaper to
+  build and update, best when points are spread evenly and queries are
+  about one cell across.
+Both support nearest(q, k), within_radius(q, r), in_box(x0, y0, x1, y1),
+insert(p) and delete(p); the brute_* functions are the linear-scan baseline.
+
+Run As : python spatial_index.py --sizes 100000 1000000 10000000
+"""
+
+import argparse
+import heapq
+import math
+import random
+import time
+from bisect import bisect_left, bisect_right
+from itertools import count
+from operator import attrgetter
+
+from point_array import ScalarPoint
+
+
+def _dist2(p, x, y):
+    dx, dy = p.x - x, p.y - y
+    return dx * dx + dy * dy
+
+
+def _same(p, q):
+    return p is q or (p.x == q.x and p.y == q.y)
+
+
+class _KNearest:
+    """The k closest points seen so far (a max-heap on distance)."""
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+        self._tie = count()  # points need not be comparable
+
+    @property
+    def worst(self):
+        return -self.heap[0][0] if len(self.heap) == self.k else math.inf
+
+    def offer(self, d2, p):
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, (-d2, next(self._tie), p))
+        elif d2 < -self.heap[0][0]:
+            heapq.heapreplace(self.heap, (-d2, next(self._tie), p))
+
+    def result(self):
+        return [p for _, _, p in sorted(self.heap, key=lambda e: (-e[0], e[1]))]
+
+
+# --- Brute force baseline ---
+def brute_nearest(points, q, k=1):
+    return heapq.nsmallest(k, points, key=lambda p: _dist2(p, q.x, q.y))
+
+
+def brute_within_radius(points, q, r):
+    r2 = r * r
+    return [p for p in points if _dist2(p, q.x, q.y) <= r2]
+
+
+def brute_in_box(points, x0, y0, x1, y1):
+    return [p for p in points if x0 <= p.x <= x1 and y0 <= p.y <= y1]
+
+
+# --- k-d tree ---
+class _Node:
+    __slots__ = ("axis", "split", "left", "right", "points", "size")
+
+    def __init__(self, points=None):
+        self.points = points  # a list for leaves, None for inner nodes
+        self.axis = self.split = self.left = self.right = None
+        self.size = 0  # points below an inner node (leaves use len(points))
+
+
+def _size(node):
+    return node.size if node.points is None else len(node.points)
+
+
+class KDTree:
+    """Bulk-loaded k-d tree; updates keep it balanced by rebuilding subtrees.
+
+    After insert() or delete(), the highest node on the path whose larger
+    child holds more than `ALPHA` of its points is rebuilt from scratch (as in
+    a scapegoat tree), so depth stays O(log n) even for sorted insertions.
+    """
+
+    ALPHA = 0.75
+
+    def __init__(self, points=(), leaf_size=32):
+        self.leaf_size = leaf_size
+        points = list(points)
+        self._len = len(points)
+        self._root = self._build(points, 0)
+
+    def _build(self, points, depth):
+        if len(points) <= self.leaf_size:
+            return _Node(points)
+        for axis in (depth % 2, 1 - depth % 2):  # if one axis has no spread, try the other
+            key = attrgetter("x" if axis == 0 else "y")
+            points.sort(key=key)
+            split = key(points[len(points) // 2])
+            mid = bisect_left(points, split, key=key)
+            if mid == 0:  # the median is the minimum, split just above it
+                mid = bisect_right(points, split, key=key)
+                if mid < len(points):
+                    split = key(points[mid])
+            if 0 < mid < len(points):
+                break
+        else:
+            return _Node(points)  # all points identical
+        node = _Node()
+        node.axis, node.split, node.size = axis, split, len(points)  # left: coord < split, right: coord >= split
+        node.left = self._build(points[:mid], depth + 1)
+        node.right = self._build(points[mid:], depth + 1)
+        return node
+
+    def _rebuild(self, node, depth):
+        """Rebuild the subtree at `node` in place, balanced."""
+        points, stack = [], [node]
+        while stack:
+            n = stack.pop()
+            if n.points is not None:
+                points.extend(n.points)
+            else:
+                stack += (n.left, n.right)
+        rebuilt = self._build(points, depth)
+        for attr in _Node.__slots__:
+            setattr(node, attr, getattr(rebuilt, attr))
+
+    def _path(self, p):
+        """The inner nodes from the root down to `p`'s leaf, and the leaf."""
+        node, path = self._root, []
+        while node.points is None:
+            path.append(node)
+            node = node.left if (p.x, p.y)[node.axis] < node.split else node.right
+        return path, node
+
+    def _rebalance(self, path, leaf):
+        for depth, node in enumerate(path):
+            if max(_size(node.left), _size(node.right)) > self.ALPHA * node.size > self.leaf_size:
+                self._rebuild(node, depth)
+                return
+        if len(leaf.points) > 2 * self.leaf_size:  # split overfull leaves in place
+            self._rebuild(leaf, len(path))
+
+    def __len__(self):
+        return self._len
+
+    def insert(self, p):
+        path, leaf = self._path(p)
+        leaf.points.append(p)
+        for node in path:
+            node.size += 1
+        self._len += 1
+        self._rebalance(path, leaf)
+
+    def delete(self, p):
+        """Remove one point equal to `p`; return whether one was found."""
+        path, leaf = self._path(p)
+        for i, other in enumerate(leaf.points):
+            if _same(other, p):
+                leaf.points[i] = leaf.points[-1]
+                leaf.points.pop()
+                for node in path:
+                    node.size -= 1
+                self._len -= 1
+                self._rebalance(path, leaf)
+                return True
+        return False
+
+    def nearest(self, q, k=1):
+        """The `k` points closest to `q`, nearest first."""
+        k = min(k, self._len)
+        if k == 0:
+            return []
+        best = _KNearest(k)
+        coords = (q.x, q.y)
+        stack = [(self._root, 0.0)]  # (node, lower bound on squared distance to it)
+        while stack:
+            node, bound = stack.pop()
+            if bound > best.worst:
+                continue
+            if node.points is not None:
+                for p in node.points:
+                    best.offer(_dist2(p, q.x, q.y), p)
+                continue
+            diff = coords[node.axis] - node.split
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+            stack.append((far, max(bound, diff * diff)))
+            stack.append((near, bound))  # popped first
+        return best.result()
+
+    def within_radius(self, q, r):
+        r2 = r * r
+        coords = (q.x, q.y)
+        found, stack = [], [self._root]
+        while stack:
+            node = stack.pop()
+            if node.points is not None:
+                found.extend(p for p in node.points if _dist2(p, q.x, q.y) <= r2)
+                continue
+            c = coords[node.axis]
+            if c - r < node.split:
+                stack.append(node.left)
+            if c + r >= node.split:
+                stack.append(node.right)
+        return found
+
+    def in_box(self, x0, y0, x1, y1):
+        lows, highs = (x0, y0), (x1, y1)
+        found, stack = [], [self._root]
+        while stack:
+            node = stack.pop()
+            if node.points is not None:
+                found.extend(p for p in node.points if x0 <= p.x <= x1 and y0 <= p.y <= y1)
+                continue
+            if lows[node.axis] < node.split:
+                stack.append(node.left)
+            if highs[node.axis] >= node.split:
+                stack.append(node.right)
+        return found
+
+
+# --- Uniform grid ---
+class UniformGrid:
+    def __init__(self, points=(), cell_size=1.0):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._len = 0
+        for p in points:
+            self.insert(p)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def __len__(self):
+        return self._len
+
+    def insert(self, p):
+        self._cells.setdefault(self._cell(p.x, p.y), []).append(p)
+        self._len += 1
+
+    def delete(self, p):
+        key = self._cell(p.x, p.y)
+        bucket = self._cells.get(key, [])
+        for i, other in enumerate(bucket):
+            if _same(other, p):
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                if not bucket:
+                    del self._cells[key]
+                self._len -= 1
+                return True
+        return False
+
+    def _buckets(self, x0, y0, x1, y1):
+        (cx0, cy0), (cx1, cy1) = self._cell(x0, y0), self._cell(x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):  # box covers more cells than exist
+            return (b for (cx, cy), b in self._cells.items() if cx0 <= cx <= cx1 and cy0 <= cy <= cy1)
+        cells = self._cells
+        return (cells[c] for c in ((cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)) if c in cells)
+
+    def in_box(self, x0, y0, x1, y1):
+        return [p for bucket in self._buckets(x0, y0, x1, y1) for p in bucket
+                if x0 <= p.x <= x1 and y0 <= p.y <= y1]
+
+    def within_radius(self, q, r):
+        r2 = r * r
+        return [p for bucket in self._buckets(q.x - r, q.y - r, q.x + r, q.y + r) for p in bucket
+                if _dist2(p, q.x, q.y) <= r2]
+
+    def nearest(self, q, k=1):
+        """Search rings of cells around `q` until no closer point can remain.
+
+        Once the rings would cover more cells than are occupied, the occupied
+        cells are searched nearest first instead.
+        """
+        k = min(k, self._len)
+        if k == 0:
+            return []
+        best = _KNearest(k)
+        cx, cy = self._cell(q.x, q.y)
+        ring = 0
+        while True:
+            if (2 * ring + 1) ** 2 > len(self._cells):
+                return self._nearest_by_cells(q, k)
+            for key in self._ring(cx, cy, ring):
+                for p in self._cells.get(key, ()):
+                    best.offer(_dist2(p, q.x, q.y), p)
+            # every unvisited cell is at least `ring` whole cells away from q
+            reach = ring * self.cell_size
+            if best.worst <= reach * reach:
+                return best.result()
+            ring += 1
+
+    def _nearest_by_cells(self, q, k):
+        size = self.cell_size
+
+        def gap2(key):  # squared distance from q to the cell's square
+            x0, y0 = key[0] * size, key[1] * size
+            dx = max(x0 - q.x, 0.0, q.x - x0 - size)
+            dy = max(y0 - q.y, 0.0, q.y - y0 - size)
+            return dx * dx + dy * dy
+
+        best = _KNearest(k)
+        for d2, key in sorted((gap2(key), key) for key in self._cells):
+            if d2 > best.worst:
+                break
+            for p in self._cells[key]:
+                best.offer(_dist2(p, q.x, q.y), p)
+        return best.result()
+
+    @staticmethod
+    def _ring(cx, cy, ring):
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
+
+
+BACKENDS = {
+    "kdtree": KDTree,
+    "grid": UniformGrid,
+}
+
+
+def make_index(kind="kdtree", points=(), **options):
+    try:
+        return BACKENDS[kind](points, **options)
+    except KeyError:
+        raise ValueError(f"Unknown index {kind!r}, choose from {list(BACKENDS)}") from None
+
+
+# --- Correctness check and benchmark ---
+def random_points(n, extent=1_000.0, seed=42):
+    rng = random.Random(seed)
+    return [ScalarPoint(rng.uniform(0, extent), rng.uniform(0, extent)) for _ in range(n)]
+
+
+def check_against_brute_force(n=5_000, queries=50):
+    """Assert both indexes return what a linear scan returns, before and after updates."""
+    points = random_points(n)
+    rng = random.Random(7)
+    indexes = [KDTree(points, leaf_size=8), UniformGrid(points, cell_size=25.0)]
+    for p in random_points(n // 10, seed=1):
+        points.append(p)
+        for index in indexes:
+            index.insert(p)
+    for p in points[::7]:
+        for index in indexes:
+            assert index.delete(p)
+    points = [p for i, p in enumerate(points) if i % 7]
+
+    def ids(found):
+        return sorted(map(id, found))
+
+    for q in random_points(queries, seed=3):
+        x0, y0 = rng.uniform(0, 900), rng.uniform(0, 900)
+        box = (x0, y0, x0 + 100, y0 + 50)
+        expected_near = [_dist2(p, q.x, q.y) for p in brute_nearest(points, q, 10)]
+        for index in indexes:
+            assert len(index) == len(points)
+            assert [_dist2(p, q.x, q.y) for p in index.nearest(q, 10)] == expected_near
+            assert ids(index.within_radius(q, 40)) == ids(brute_within_radius(points, q, 40))
+            assert ids(index.in_box(*box)) == ids(brute_in_box(points, *box))
+    print(f"Indexes match brute force: {len(points):,} points, {queries} queries")
+
+
+def _latency_us(func, queries):
+    start = time.perf_counter()
+    for q in queries:
+        func(q)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def benchmark(sizes=(100_000, 1_000_000), queries=200, brute_queries=5, k=10):
+    """Build time and mean query latency of each index vs a linear scan."""
+    extent = 1_000.0
+    print(f"\n--- Spatial Index Benchmark (uniform points, {queries} queries, k={k}) ---")
+    print(f"{'points':>11} {'index':<8} {'build s':>8} {'nearest us':>11} {'radius us':>11} {'box us':>11}")
+    for n in sizes:
+        points = random_points(n, extent)
+        targets = random_points(queries, extent, seed=3)
+        r = extent * math.sqrt(k / (math.pi * n))  # a radius that holds about k points
+        side = 2 * r
+
+        def run(label, build, nearest, radius, box, qs):
+            start = time.perf_counter()
+            index = build()
+            built = time.perf_counter() - start
+            print(f"{n:>11,} {label:<8} {built:>8.2f} "
+                  f"{_latency_us(lambda q: nearest(index, q), qs):>11,.1f} "
+                  f"{_latency_us(lambda q: radius(index, q), qs):>11,.1f} "
+                  f"{_latency_us(lambda q: box(index, q), qs):>11,.1f}")
+
+        run("brute", lambda: points,
+            lambda ps, q: brute_nearest(ps, q, k),
+            lambda ps, q: brute_within_radius(ps, q, r),
+            lambda ps, q: brute_in_box(ps, q.x, q.y, q.x + side, q.y + side),
+            targets[:brute_queries])
+        for label, build in (("kdtree", lambda: KDTree(points)),
+                             ("grid", lambda: UniformGrid(points, cell_size=side))):
+            run(label, build,
+                lambda index, q: index.nearest(q, k),
+                lambda index, q: index.within_radius(q, r),
+                lambda index, q: index.in_box(q.x, q.y, q.x + side, q.y + side),
+                targets)
+        del points
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    check_against_brute_force()
+    benchmark(args.sizes, args.queries)
@@ -1,36 +1,64 @@
+from itertools import islice
+from collections import Counter
+
+from tag_counters import make_counter, normalize_tag
+
+
 class TagCloud:
-    def __init__(self):
-        self.__tags = {}
-        
+    # mode="exact" keeps every tag; "count-min" and "space-saving" use fixed
+    # memory and return approximate counts (see tag_counters.py).
+    # cloud[tag] = n works in "exact" and "space-saving" mode; a count-min
+    # sketch can only add, so it raises TypeError.
+    def __init__(self, mode="exact", **options):
+        self.__tags = make_counter(mode, **options)
+
     def add(self, tag):
-        tag = tag.strip().lower()  # Normalize the tag to lowercase and remove leading/trailing spaces
-        if tag in self.__tags:   # alternative : self.tags[tag] = self.tags.get(tag, 0) + 1
-            self.__tags[tag] += 1
-        else:
-            self.__tags[tag] = 1
-            
+        tag = normalize_tag(tag)  # Normalize the tag to lowercase and remove leading/trailing spaces (cached)
+        self.__tags.add(tag)
+
+    def add_many(self, tags, chunk_size=100_000):
+        tags = iter(tags)
+        while chunk := list(islice(tags, chunk_size)):
+            for tag, n in Counter(map(normalize_tag, chunk)).items():  # pre-aggregate the chunk in C
+                self.__tags.add(tag, n)
+
+    def most_common(self, k=10):
+        return self.__tags.most_common(k)
+
+    def items(self):
+        # (tag, count) pairs, e.g. for tag_snapshots.write_snapshot
+        return self.__tags.items()
+
     def __getitem__(self, tag):
-        tag = tag.strip().lower()
-        return self.__tags.get(tag, 0)
-    
+        tag = normalize_tag(tag)
+        return self.__tags.get(tag)
+
     def __setitem__(self, tag, count):
-        tag = tag.strip().lower()
+        tag = normalize_tag(tag)
         if count <= 0:
             raise ValueError("Count must be positive")
-        self.__tags[tag] = count
-        
+        self.__tags.set(tag, count)
+
     def __len__(self):
         return len(self.__tags)
-    
+
     def __iter__(self):
         return iter(self.__tags)
 
 
-cloud = TagCloud()
-cloud.add("python")
-cloud.add("python")
-cloud.add("python")
-cloud.add("PythOn")
+if __name__ == "__main__":
+    cloud = TagCloud()
+    cloud.add("python")
+    cloud.add("python")
+    cloud.add("python")
+    cloud.add("PythOn")
+    print(cloud["PYTHON"], cloud.most_common(1))
 
+    approximate = TagCloud("space-saving", capacity=2)
+    approximate.add_many(["python", "java", " Python", "rust", "python"])
+    print(approximate.most_common(2))
 
-print(cloud.__tags)
\ No newline at end of file
+    try:
+        print(cloud.__tags)
+    except AttributeError as ex:  # private attributes are name-mangled
+        print("AttributeError:", ex)
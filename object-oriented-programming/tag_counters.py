@@ -0,0 +1,255 @@
+"""
+Counting backends for TagCloud.
+
+ExactCounter keeps every tag. The two approximate backends use fixed memory
+however many distinct tags arrive:
+- CountMinSketch estimates the count of any tag (never under-counting) and
+  tracks the `top` heaviest tags it has seen.
+- SpaceSaving keeps exact-or-over counts for at most `capacity` tags,
+  evicting the smallest one to make room.
+All backends share one small interface: add, get, set, most_common, items,
+len, iter.
+"""
+
+import heapq
+import random
+import sys
+import time
+import tracemalloc
+import zlib
+from array import array
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+
+
+@lru_cache(maxsize=65_536)  # bounded, so hot tags skip strip()/lower()
+def normalize_tag(tag):
+    return tag.strip().lower()
+
+
+class ExactCounter:
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, tag, n=1):
+        self.counts[tag] = self.counts.get(tag, 0) + n
+
+    def get(self, tag):
+        return self.counts.get(tag, 0)
+
+    def set(self, tag, count):
+        self.counts[tag] = count
+
+    def most_common(self, k):
+        return heapq.nlargest(k, self.counts.items(), key=itemgetter(1))
+
+    def items(self):
+        return self.counts.items()
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __iter__(self):
+        return iter(self.counts)
+
+
+class CountMinSketch:
+    """`depth` rows of `width` counters; a tag's estimate is its row minimum.
+
+    Slots come from crc32 rather than hash(), which is salted per process,
+    so sketches with the same width, depth and seed agree across runs and
+    processes and can be merged row by row.
+    """
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(self, width=2 ** 16, depth=4, top=100, seed=0):
+        self.width, self.depth, self.top = width, depth, top
+        rng = random.Random(seed)
+        self._salts = [(rng.randrange(1, self._PRIME), rng.randrange(self._PRIME)) for _ in range(depth)]
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self._heavy = {}  # up to `top` tags with their latest estimates
+        self._heap = []  # (estimate, tag) for the heavy tags; stale ones are skipped lazily
+
+    def _slots(self, tag):
+        h = zlib.crc32(tag.encode("utf-8"))
+        return [((a * h + b) % self._PRIME) % self.width for a, b in self._salts]
+
+    def add(self, tag, n=1):
+        estimate = None
+        for row, slot in zip(self._rows, self._slots(tag)):
+            row[slot] += n
+            if estimate is None or row[slot] < estimate:
+                estimate = row[slot]
+        self._track(tag, estimate)
+
+    def _track(self, tag, estimate):
+        heavy, heap = self._heavy, self._heap
+        if tag in heavy or len(heavy) < self.top:
+            heavy[tag] = estimate
+            heapq.heappush(heap, (estimate, tag))
+            if len(heap) > 4 * self.top:  # drop stale entries
+                self._heap = [(e, t) for t, e in heavy.items()]
+                heapq.heapify(self._heap)
+            return
+        while heavy.get(heap[0][1]) != heap[0][0]:  # estimates only grow, so stale entries are smaller
+            heapq.heappop(heap)
+        if estimate > heap[0][0]:
+            _, smallest = heapq.heapreplace(heap, (estimate, tag))
+            del heavy[smallest]
+            heavy[tag] = estimate
+
+    def get(self, tag):
+        return min(row[slot] for row, slot in zip(self._rows, self._slots(tag)))
+
+    def set(self, tag, count):
+        raise TypeError("A count-min sketch can only add to counts")
+
+    def most_common(self, k):
+        if k > self.top:
+            raise ValueError(f"Only the top {self.top} tags are tracked")
+        return heapq.nlargest(k, self._heavy.items(), key=itemgetter(1))
+
+    def items(self):
+        return self._heavy.items()
+
+    def __len__(self):
+        return len(self._heavy)
+
+    def __iter__(self):
+        return iter(self._heavy)
+
+
+class SpaceSaving:
+    """Counts for at most `capacity` tags (Metwally et al.'s Space-Saving).
+
+    A new tag arriving when full replaces the smallest tracked tag and
+    inherits its count, so counts may over-estimate by at most errors[tag].
+    """
+
+    def __init__(self, capacity=10_000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self._heap = []  # (count, tag) entries; stale ones are skipped lazily
+
+    def _push(self, tag, count):
+        heapq.heappush(self._heap, (count, tag))
+        if len(self._heap) > 4 * self.capacity:  # drop stale entries
+            self._heap = [(c, t) for t, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_smallest(self):
+        while True:
+            count, tag = heapq.heappop(self._heap)
+            if self.counts.get(tag) == count:
+                return tag, count
+
+    def add(self, tag, n=1):
+        counts = self.counts
+        if tag in counts:
+            counts[tag] += n
+        elif len(counts) < self.capacity:
+            counts[tag] = n
+            self.errors[tag] = 0
+        else:
+            evicted, floor = self._pop_smallest()
+            del counts[evicted], self.errors[evicted]
+            counts[tag] = floor + n
+            self.errors[tag] = floor
+        self._push(tag, counts[tag])
+
+    def get(self, tag):
+        return self.counts.get(tag, 0)
+
+    def set(self, tag, count):
+        if tag not in self.counts and len(self.counts) >= self.capacity:
+            evicted, _ = self._pop_smallest()
+            del self.counts[evicted], self.errors[evicted]
+        self.counts[tag] = count
+        self.errors.setdefault(tag, 0)
+        self._push(tag, count)
+
+    def most_common(self, k):
+        return heapq.nlargest(k, self.counts.items(), key=itemgetter(1))
+
+    def items(self):
+        return self.counts.items()
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __iter__(self):
+        return iter(self.counts)
+
+
+BACKENDS = {
+    "exact": ExactCounter,
+    "count-min": CountMinSketch,
+    "space-saving": SpaceSaving,
+}
+
+
+def make_counter(mode="exact", **options):
+    try:
+        return BACKENDS[mode](**options)
+    except KeyError:
+        raise ValueError(f"Unknown mode {mode!r}, choose from {list(BACKENDS)}") from None
+
+
+# --- Benchmark ---
+def zipf_tags(n, distinct, s=1.1, seed=42):
+    """`n` tags drawn from `distinct` tags with Zipf-like (power law) frequencies."""
+    rng = random.Random(seed)
+    weights = [1 / (rank ** s) for rank in range(1, distinct + 1)]
+    return rng.choices([f"Tag{rank}" for rank in range(distinct)], weights=weights, k=n)
+
+
+def benchmark(n=1_000_000, distinct=200_000, k=20):
+    """adds/sec, traced memory and top-k accuracy of each TagCloud mode."""
+    from tag_cloud_demo import TagCloud
+
+    tags = zipf_tags(n, distinct)
+    truth = Counter(normalize_tag(t) for t in tags)
+    true_top = truth.most_common(k)
+    configs = [
+        ("exact", {}),
+        ("count-min", {"width": 2 ** 12, "depth": 4, "top": k}),
+        ("count-min", {"width": 2 ** 16, "depth": 4, "top": k}),
+        ("space-saving", {"capacity": 1_000}),
+        ("space-saving", {"capacity": 10_000}),
+    ]
+    print(f"\n--- TagCloud Benchmark ({n:,} adds, {distinct:,} distinct, top {k}) ---")
+    print(f"{'mode':<38} {'add/sec':>10} {'add_many/sec':>13} {'memory MB':>10} "
+          f"{'top-k recall':>13} {'mean rel err':>13}")
+    for mode, options in configs:
+        label = mode + "".join(f" {key}={value}" for key, value in options.items())
+
+        cloud = TagCloud(mode, **options)
+        start = time.perf_counter()
+        for tag in tags:
+            cloud.add(tag)
+        add_rate = n / (time.perf_counter() - start)
+
+        cloud = TagCloud(mode, **options)
+        start = time.perf_counter()
+        cloud.add_many(tags)
+        bulk_rate = n / (time.perf_counter() - start)
+
+        tracemalloc.start()  # separate run, tracing slows everything down
+        traced = TagCloud(mode, **options)
+        traced.add_many(tags)
+        memory = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+        tracemalloc.stop()
+        del traced
+
+        found = {tag for tag, _ in cloud.most_common(k)}
+        recall = len(found & {tag for tag, _ in true_top}) / k
+        error = sum(abs(cloud[tag] - count) / count for tag, count in true_top) / k
+        print(f"{label:<38} {add_rate:>10,.0f} {bulk_rate:>13,.0f} {memory:>10.1f} "
+              f"{recall:>13.2f} {error:>13.4f}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
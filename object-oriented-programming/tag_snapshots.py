@@ -0,0 +1,243 @@
+"""
+Compact, mergeable TagCloud snapshots.
+
+A snapshot file is:
+    b"TAGS" | version (1 byte) | record count (8 bytes, little endian)
+    then, sorted by the UTF-8 bytes of the tag:
+    varint(len(tag)) | tag bytes | varint(count)
+
+Readers memory-map the file and decode records in place, so opening a
+snapshot costs nothing up front. Because every file is sorted, N snapshots
+merge in one streaming k-way pass that holds a single record per input, and
+the result is itself a snapshot, so merging is associative.
+
+Run As : python tag_snapshots.py --snapshots 64 --tags 10000000
+"""
+
+import argparse
+import heapq
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+import time
+from operator import itemgetter
+
+
+MAGIC = b"TAGS"
+VERSION = 1
+HEADER = struct.Struct("<4sBQ")
+
+
+# --- Varints (LEB128) ---
+def encode_varint(n):
+    if n < 0x80:  # the common case: one byte
+        return bytes((n,))
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def decode_varint(buf, pos):
+    """Decode the varint at buf[pos]; return (value, next position)."""
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+# --- Writing ---
+class SnapshotWriter:
+    """Write (tag bytes, count) records that arrive already sorted.
+
+    Records go to a temporary file next to `path`, which replaces `path` only
+    on a clean close(). A failed write never leaves a truncated snapshot
+    behind, and `path` may be one of the snapshots being read (e.g. when
+    merging into an existing snapshot).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0))  # count patched on close
+        self.count = 0
+        self._last = None
+
+    def write(self, key, count):
+        if self._last is not None and key <= self._last:
+            raise ValueError("Snapshot records must be written in strictly sorted order")
+        self._last = key
+        self._file.write(encode_varint(len(key)) + key + encode_varint(count))
+        self.count += 1
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.count))
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Discard everything written; `path` is left untouched."""
+        self._file.close()
+        os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_snapshot(path, counts):
+    """Save a tag -> count mapping (or a TagCloud) as a snapshot file."""
+    items = sorted((tag.encode("utf-8"), n) for tag, n in counts.items())
+    with SnapshotWriter(path) as writer:
+        for key, count in items:
+            writer.write(key, count)
+
+
+# --- Reading ---
+class SnapshotReader:
+    """Memory-mapped view of one snapshot; iterates records in sorted order."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{path} is not a tag snapshot")
+        magic, version, self.count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} tag snapshot")
+
+    def raw_items(self):
+        """Yield (tag bytes, count), decoding straight from the mapping."""
+        buf = self._mmap
+        pos = HEADER.size
+        for _ in range(self.count):
+            length, pos = decode_varint(buf, pos)
+            key = buf[pos:pos + length]
+            count, pos = decode_varint(buf, pos + length)
+            yield key, count
+
+    def items(self):
+        for key, count in self.raw_items():
+            yield key.decode("utf-8"), count
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_snapshot(path):
+    """Read a whole snapshot into a dict."""
+    with SnapshotReader(path) as reader:
+        return dict(reader.items())
+
+
+# --- Merging ---
+def merge_snapshots(paths, out_path):
+    """Sum any number of snapshots into `out_path` with a streaming k-way merge.
+
+    Only one record per input is held in memory at a time, and `out_path` may
+    be one of `paths`. Returns the number of distinct tags written.
+    """
+    readers = [SnapshotReader(path) for path in paths]
+    try:
+        with SnapshotWriter(out_path) as writer:
+            current, total = None, 0
+            for key, count in heapq.merge(*(r.raw_items() for r in readers), key=itemgetter(0)):
+                if key != current:
+                    if current is not None:
+                        writer.write(current, total)
+                    current, total = key, 0
+                total += count
+            if current is not None:
+                writer.write(current, total)
+            return writer.count
+    finally:
+        for reader in readers:
+            reader.close()
+
+
+# --- Correctness check and benchmark ---
+def check_merge():
+    """Assert that merging snapshots of two TagClouds sums their counts."""
+    from collections import Counter
+    from tag_cloud_demo import TagCloud
+
+    first, second = TagCloud(), TagCloud()
+    first.add_many(["python", "java", "Python ", "café"])
+    second.add_many(["rust", "python", "CAFÉ", "go"])
+    tmp = tempfile.mkdtemp()
+    try:
+        paths = [os.path.join(tmp, name) for name in ("a.tags", "b.tags", "merged.tags")]
+        write_snapshot(paths[0], first)
+        write_snapshot(paths[1], second)
+        merge_snapshots(paths[:2], paths[2])
+        expected = Counter(dict(first.items())) + Counter(dict(second.items()))
+        assert load_snapshot(paths[2]) == expected, "merged counts differ"
+        merge_snapshots(paths[:2], paths[0])  # accumulate into an input
+        assert load_snapshot(paths[0]) == expected, "merging into an input lost counts"
+        print(f"Merged snapshot: {load_snapshot(paths[2])}")
+    finally:
+        shutil.rmtree(tmp)
+
+
+def benchmark(snapshots=64, tags=10_000_000, universe=None, seed=42):
+    """Time writing `snapshots` snapshots of `tags` tags each and merging them."""
+    universe = universe or tags * 2
+    rng = random.Random(seed)
+    tmp = tempfile.mkdtemp()
+    try:
+        print(f"\n--- Snapshot Merge Benchmark ({snapshots} x {tags:,} tags) ---")
+        paths = []
+        start = time.perf_counter()
+        for s in range(snapshots):
+            ids = rng.sample(range(universe), tags)
+            path = os.path.join(tmp, f"shard{s:03d}.tags")
+            write_snapshot(path, {f"tag{i}": 1 + i % 97 for i in ids})
+            paths.append(path)
+        size_mb = sum(os.path.getsize(p) for p in paths) / (1024 * 1024)
+        print(f"{'write snapshots':<18} {time.perf_counter() - start:>8.2f} s  ({size_mb:,.0f} MB on disk)")
+
+        out = os.path.join(tmp, "merged.tags")
+        start = time.perf_counter()
+        distinct = merge_snapshots(paths, out)
+        elapsed = time.perf_counter() - start
+        records = snapshots * tags
+        print(f"{'k-way merge':<18} {elapsed:>8.2f} s  ({records / elapsed:,.0f} records/sec, "
+              f"{distinct:,} distinct tags)")
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--snapshots", type=int, default=64)
+    parser.add_argument("--tags", type=int, default=10_000_000)
+    args = parser.parse_args()
+    check_merge()
+    benchmark(args.snapshots, args.tags)
@@ -0,0 +1,166 @@
+"""
+Async Subprocess Demo
+Runs many external commands concurrently on asyncio with a concurrency
+limit, streams each command's stdout/stderr line by line instead of
+buffering whole outputs, enforces per-command timeouts and aggregates the
+exit codes.
+
+Run As : python async_subprocess.py --commands 1000 --concurrency 64
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import time
+import argparse
+from collections import Counter, namedtuple
+
+
+CommandResult = namedtuple("CommandResult", ["args", "returncode", "timed_out", "seconds"])
+
+TIMEOUT_RETURNCODE = None  # returncode recorded for commands that were killed
+NOT_FOUND_RETURNCODE = 127  # as in the shell, for commands that cannot start
+DRAIN_TIMEOUT = 1.0  # seconds to read leftover output after a kill
+EXIT_POLL = 0.05  # seconds between exit checks while something else holds the pipes
+
+
+# --- Running ---
+async def _pump(stream, name, args, on_line, chunk_size=64 * 1024):
+    # split fixed-size chunks ourselves: readline() fails on lines over 64 KiB
+    buffer = bytearray()
+    while chunk := await stream.read(chunk_size):
+        buffer += chunk
+        end = buffer.rfind(b"\n", len(buffer) - len(chunk))
+        if end < 0:
+            continue
+        for line in buffer[:end].split(b"\n"):
+            on_line(args, name, line.decode(errors="replace"))
+        del buffer[:end + 1]
+    if buffer:
+        on_line(args, name, buffer.decode(errors="replace"))
+
+
+def _kill(proc):
+    """Kill the command and anything it started (its whole session)."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:  # already gone
+        pass
+
+
+async def _wait_exit(proc):
+    """Return the exit code once the process itself has exited.
+
+    proc.wait() also waits for stdout/stderr to close, which never happens
+    while a background grandchild holds them, so fall back to polling.
+    """
+    waiting = asyncio.ensure_future(proc.wait())
+    while proc.returncode is None:
+        await asyncio.wait([waiting], timeout=EXIT_POLL)
+    waiting.cancel()
+    return proc.returncode
+
+
+def _discard(args, stream, line):
+    pass
+
+
+async def run_command(args, timeout=None, on_line=_discard):
+    """Run one command, passing each output line to on_line(args, stream, line).
+
+    `timeout` bounds both the process and its output. The result is marked
+    timed_out only if the process had not exited by then, in which case it
+    (and its process group) is killed; if it exited but a background child
+    still holds its pipes, the group is killed and its exit code kept.
+    """
+    start = time.perf_counter()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,  # its own process group, so a timeout can kill grandchildren
+        )
+    except OSError as ex:
+        on_line(args, "stderr", str(ex))
+        return CommandResult(args, NOT_FOUND_RETURNCODE, False, time.perf_counter() - start)
+    pumps = asyncio.gather(
+        _pump(proc.stdout, "stdout", args, on_line),
+        _pump(proc.stderr, "stderr", args, on_line),
+    )
+    exited = asyncio.ensure_future(_wait_exit(proc))
+    # one deadline for the process and its output
+    done, _ = await asyncio.wait([pumps, exited], timeout=timeout, return_when=asyncio.ALL_COMPLETED)
+    timed_out = exited not in done
+    if timed_out:
+        _kill(proc)
+        await exited
+    if pumps not in done:
+        if not timed_out:
+            _kill(proc)  # exited, but grandchildren still hold the pipes
+        try:  # drain whatever was written before the kill, unless something still holds the pipe
+            await asyncio.wait_for(pumps, DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass  # wait_for has cancelled the pumps
+    returncode = TIMEOUT_RETURNCODE if timed_out else exited.result()
+    return CommandResult(args, returncode, timed_out, time.perf_counter() - start)
+
+
+async def run_commands(commands, concurrency=32, timeout=None, on_line=_discard):
+    """Run `commands` with at most `concurrency` in flight at once.
+
+    Results come back in the same order as `commands`.
+    """
+    limit = asyncio.Semaphore(concurrency)
+
+    async def bounded(args):
+        async with limit:
+            return await run_command(args, timeout, on_line)
+
+    return await asyncio.gather(*(bounded(args) for args in commands))
+
+
+def summarize(results):
+    """Aggregate exit codes: {"ok", "failed", "timed_out", "codes"}."""
+    codes = Counter(r.returncode for r in results if not r.timed_out)
+    return {
+        "ok": codes.get(0, 0),
+        "failed": sum(n for code, n in codes.items() if code != 0),
+        "timed_out": sum(r.timed_out for r in results),
+        "codes": dict(codes),
+    }
+
+
+def execute(commands, concurrency=32, timeout=None, on_line=_discard):
+    """Blocking entry point: run everything and return (results, summary)."""
+    results = asyncio.run(run_commands(commands, concurrency, timeout, on_line))
+    return results, summarize(results)
+
+
+# --- Benchmark ---
+def benchmark(n=1_000, concurrency=(8, 64)):
+    """Commands/sec for n short commands, serial subprocess.run vs async."""
+    commands = [["echo", f"job {i}"] for i in range(n)]
+    print(f"\n--- Subprocess Benchmark ({n:,} commands) ---")
+
+    start = time.perf_counter()
+    for args in commands:
+        subprocess.run(args, capture_output=True, text=True)
+    print(f"{'serial subprocess.run':<26} {n / (time.perf_counter() - start):>10,.0f} commands/sec")
+
+    for limit in concurrency:
+        start = time.perf_counter()
+        _, summary = execute(commands, concurrency=limit)
+        elapsed = time.perf_counter() - start
+        assert summary["ok"] == n, summary
+        print(f"{f'async, concurrency={limit}':<26} {n / elapsed:>10,.0f} commands/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commands", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 64, os.cpu_count() * 8])
+    args = parser.parse_args()
+    benchmark(args.commands, args.concurrency)
@@ -0,0 +1,137 @@
+"""
+Streaming CSV Demo
+Reads and writes CSV files in fixed-size batches so peak memory stays flat
+no matter how large the file is.
+
+Run As : python csv_streaming.py --rows 1000000 10000000 --batch-size 10000
+"""
+
+import csv
+import os
+import sys
+import time
+import argparse
+from collections import namedtuple
+from itertools import islice
+
+try:
+    import resource  # Unix only, used for peak RSS in the benchmark
+except ImportError:
+    resource = None
+
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+# --- Writing ---
+def write_csv_batches(path, header, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Write `rows` (any iterable) under `header`, `batch_size` rows at a time.
+
+    Returns the number of data rows written.
+    """
+    rows = iter(rows)
+    written = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        while batch := list(islice(rows, batch_size)):
+            writer.writerows(batch)
+            written += len(batch)
+    return written
+
+
+# --- Reading ---
+def read_csv_batches(path, types=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield lists of at most `batch_size` typed records from a CSV file.
+
+    The first row is the header; each record is a namedtuple built from it.
+    `types` maps column names to converters (e.g. {"Age": int}); columns not
+    listed stay as strings. Blank lines are skipped, as csv.DictReader does;
+    a row with the wrong number of fields raises ValueError.
+    """
+    with open(path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        Record = namedtuple("Record", header, rename=True)
+        types = types or {}
+        converters = [types.get(name, str) for name in header]
+        make = Record._make
+        width = len(header)
+        rows = filter(None, reader)  # csv.reader yields [] for a blank line
+
+        while chunk := list(islice(rows, batch_size)):
+            for row in chunk:
+                if len(row) != width:
+                    raise ValueError(f"{path}: expected {width} fields {header}, got {len(row)}: {row}")
+            yield [
+                make([conv(value) for conv, value in zip(converters, row)])
+                for row in chunk
+            ]
+
+
+def iter_csv_records(path, types=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield typed records one at a time, reading the file in batches."""
+    for batch in read_csv_batches(path, types, batch_size):
+        yield from batch
+
+
+# --- Benchmark ---
+def synthetic_people(n):
+    for i in range(n):
+        yield (f"person_{i}", 18 + i % 80)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (NaN where unsupported)."""
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _bench_write(path, n, batch_size):
+    start = time.perf_counter()
+    write_csv_batches(path, ["Name", "Age"], synthetic_people(n), batch_size)
+    return time.perf_counter() - start, peak_rss_mb()
+
+
+def _bench_read(path, n, batch_size):
+    start = time.perf_counter()
+    count = 0
+    for batch in read_csv_batches(path, {"Age": int}, batch_size):
+        count += len(batch)
+    assert count == n, f"expected {n} rows, read {count}"
+    return time.perf_counter() - start, peak_rss_mb()
+
+
+def benchmark(sizes=(1_000_000, 10_000_000), batch_size=DEFAULT_BATCH_SIZE,
+              path="people_bench.csv"):
+    """Report rows/sec and peak RSS for streaming write and read.
+
+    Each phase runs in a fresh worker process so its peak RSS is not
+    polluted by earlier runs.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # only the benchmark needs worker processes
+
+    print(f"\n--- Streaming CSV Benchmark (batch_size={batch_size}) ---")
+    print(f"{'rows':>12} {'phase':>6} {'rows/sec':>14} {'peak RSS MB':>12}")
+    try:
+        for n in sizes:
+            for phase, fn in (("write", _bench_write), ("read", _bench_read)):
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    elapsed, peak = pool.submit(fn, path, n, batch_size).result()
+                print(f"{n:>12,} {phase:>6} {n / elapsed:>14,.0f} {peak:>12.1f}")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    benchmark(args.rows, args.batch_size)
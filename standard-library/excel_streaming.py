@@ -0,0 +1,114 @@
+"""
+Streaming Excel Demo
+Writes .xlsx files row by row with openpyxl's write-only mode and reads
+them back with read-only mode, so neither side builds the whole sheet (or
+a pandas DataFrame) in memory.
+
+Run As : python excel_streaming.py --rows 100000 1000000
+"""
+
+import os
+import time
+import argparse
+
+from openpyxl import Workbook, load_workbook
+
+
+# --- Writing ---
+def write_xlsx_rows(path, header, rows, sheet="Sheet1"):
+    """Stream `header` and then `rows` (any iterable) into a new workbook.
+
+    Returns the number of data rows written.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet)
+    ws.append(header)
+    count = 0
+    for row in rows:
+        ws.append(row)
+        count += 1
+    wb.save(path)
+    return count
+
+
+# --- Reading ---
+def iter_xlsx_rows(path, sheet=None):
+    """Yield each row of `sheet` (the active sheet by default) as a tuple."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.active
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()  # read-only workbooks keep the file open until closed
+
+
+def iter_xlsx_records(path, sheet=None):
+    """Yield {header: value} dicts, taking the first row as the header."""
+    rows = iter_xlsx_rows(path, sheet)
+    header = next(rows, None)
+    if header is None:
+        return
+    for row in rows:
+        yield dict(zip(header, row))
+
+
+# --- Benchmark ---
+def synthetic_people(n):
+    for i in range(n):
+        yield (f"person_{i}", 18 + i % 80)
+
+
+def _roundtrip_openpyxl(path, n):
+    from csv_streaming import peak_rss_mb
+
+    start = time.perf_counter()
+    write_xlsx_rows(path, ["Name", "Age"], synthetic_people(n))
+    written = time.perf_counter()
+    count = sum(1 for _ in iter_xlsx_records(path))
+    assert count == n, f"expected {n} rows, read {count}"
+    return written - start, time.perf_counter() - written, peak_rss_mb()
+
+
+def _roundtrip_pandas(path, n):
+    """The original handle_excel path: DataFrame, to_excel, read_excel."""
+    import pandas as pd
+    from csv_streaming import peak_rss_mb
+
+    start = time.perf_counter()
+    df = pd.DataFrame([{"Name": name, "Age": age} for name, age in synthetic_people(n)])
+    df.to_excel(path, index=False)
+    written = time.perf_counter()
+    count = len(pd.read_excel(path))
+    assert count == n, f"expected {n} rows, read {count}"
+    return written - start, time.perf_counter() - written, peak_rss_mb()
+
+
+def benchmark(sizes=(100_000, 1_000_000), path="people_bench.xlsx"):
+    """Compare write/read time and peak RSS of openpyxl streaming vs pandas.
+
+    Each run happens in a fresh worker process so peak RSS is its own.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    print("\n--- Excel Benchmark ---")
+    print(f"{'rows':>10} {'path':>9} {'write s':>9} {'read s':>9} {'peak RSS MB':>12}")
+    try:
+        for n in sizes:
+            for label, fn in (("openpyxl", _roundtrip_openpyxl), ("pandas", _roundtrip_pandas)):
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    try:
+                        write_s, read_s, peak = pool.submit(fn, path, n).result()
+                    except ImportError as ex:
+                        print(f"{n:>10,} {label:>9} skipped ({ex})")
+                        continue
+                print(f"{n:>10,} {label:>9} {write_s:>9.2f} {read_s:>9.2f} {peak:>12.1f}")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    benchmark(args.rows)
@@ -1,45 +1,50 @@
 """
 Complete Python Demo: File Handling & SQLite Database Operations
 This script demonstrates how to handle CSV, JSON, XML, YAML, Excel, ZIP files, and SQLite databases.
+
+Each handler imports its own dependencies on first use, so running one
+handler never pays for pandas/yaml/openpyxl/zipfile imports it does not need.
+
+Run As : python file_handling_sqlite_demo.py                 # all handlers
+         python file_handling_sqlite_demo.py csv sqlite      # selected handlers
+         python file_handling_sqlite_demo.py --startup-benchmark [--max-import-ms 100]
 """
 
-import csv
-import json
-import yaml
-import zipfile
-import pandas as pd
-import sqlite3
-import xml.etree.ElementTree as ET
-from openpyxl import Workbook
+import argparse
+import os
+import sys
 
 
 # --- CSV Handling ---
-def handle_csv():
-    data = [["Name", "Age"], ["Alice", 30], ["Bob", 25]]
-    with open("people.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(data)
+def handle_csv(batch_size=2):
+    from csv_streaming import write_csv_batches, read_csv_batches
+
+    people = [["Alice", 30], ["Bob", 25]]
+    write_csv_batches("people.csv", ["Name", "Age"], people, batch_size)
 
-    with open("people.csv", "r") as f:
-        reader = csv.reader(f)
-        print("\nCSV Data:")
-        for row in reader:
-            print(row)
+    print("\nCSV Data:")
+    for batch in read_csv_batches("people.csv", {"Age": int}, batch_size):
+        for record in batch:
+            print(record)
 
 
 # --- JSON Handling ---
 def handle_json():
+    import json_codec
+
     data = {"name": "Alice", "age": 30, "city": "London"}
     with open("data.json", "w") as f:
-        json.dump(data, f, indent=4)
+        json_codec.dump(data, f)
 
     with open("data.json", "r") as f:
-        loaded = json.load(f)
+        loaded = json_codec.load(f)
         print("\nJSON Data:", loaded)
 
 
 # --- YAML Handling ---
 def handle_yaml():
+    import yaml
+
     config = {"app": "demo", "version": 1.0, "features": ["a", "b"]}
     with open("config.yml", "w") as f:
         yaml.dump(config, f)
@@ -51,67 +56,96 @@ def handle_yaml():
 
 # --- XML Handling ---
 def handle_xml():
-    root = ET.Element("People")
-    person = ET.SubElement(root, "Person")
-    ET.SubElement(person, "Name").text = "Alice"
-    ET.SubElement(person, "Age").text = "30"
-    tree = ET.ElementTree(root)
-    tree.write("people.xml")
-
-    tree = ET.parse("people.xml")
-    root = tree.getroot()
+    from xml_streaming import iter_records, write_records
+
+    people = [{"Name": "Alice", "Age": 30}]
+    write_records("people.xml", people, root_tag="People", record_tag="Person")
+
     print("\nXML Data:")
-    for p in root.findall("Person"):
-        print(p.find("Name").text, p.find("Age").text)
+    for p in iter_records("people.xml", tag="Person"):
+        print(p["Name"], p["Age"])
 
 
 # --- Excel Handling ---
 def handle_excel():
-    df = pd.DataFrame([{"Name": "Alice", "Age": 30}, {"Name": "Bob", "Age": 25}])
-    df.to_excel("people.xlsx", index=False)
-    loaded_df = pd.read_excel("people.xlsx")
-    print("\nExcel Data:\n", loaded_df)
+    from excel_streaming import write_xlsx_rows, iter_xlsx_records
+
+    people = [("Alice", 30), ("Bob", 25)]
+    write_xlsx_rows("people.xlsx", ["Name", "Age"], people)
+
+    print("\nExcel Data:")
+    for record in iter_xlsx_records("people.xlsx"):
+        print(record)
 
 
 # --- ZIP Handling ---
-def handle_zip():
-    with zipfile.ZipFile("archive.zip", "w") as zipf:
-        zipf.write("people.csv")
-        zipf.write("data.json")
+def handle_zip(level=6, workers=None):
+    import zipfile
+    from zip_archiver import create_archive, extract_members
+
+    # Archive whichever csv/json outputs exist, so the handler can run alone
+    paths = [p for p in ("people.csv", "data.json") if os.path.exists(p)]
+    create_archive("archive.zip", paths, level, workers)
 
     with zipfile.ZipFile("archive.zip", "r") as zipf:
         print("\nZIP Contents:", zipf.namelist())
-        zipf.extractall("unzipped_files")
+    extract_members("archive.zip", ["*.csv", "*.json"], "unzipped_files")
 
 
 # --- SQLite Handling ---
-def handle_sqlite():
+def handle_sqlite(profile="default"):
+    from sqlite_bulk import ensure_movies_schema, bulk_load_movies
+    from sqlite_pool import get_pool
+    from movies_query import ALL_MOVIES, ensure_movie_indexes
+
     movies = [
         {"id": 1, "title": "Inception", "year": 2010},
         {"id": 2, "title": "Interstellar", "year": 2014},
     ]
 
-    with sqlite3.connect("demo.db") as conn:
-        conn.execute(
-            """CREATE TABLE IF NOT EXISTS Movies (id INTEGER, title TEXT, year INTEGER)"""
-        )
-        conn.executemany(
-            "INSERT OR REPLACE INTO Movies VALUES (?, ?, ?)",
-            [tuple(m.values()) for m in movies],
-        )
-        conn.commit()
-        cursor = conn.execute("SELECT * FROM Movies")
-        print("\nSQLite Data:")
-        for row in cursor.fetchall():
-            print(row)
+    # Connections are pooled per thread, so repeated calls skip connection
+    # setup and reuse already-prepared statements
+    pool = get_pool("demo.db", profile=profile)
+    conn = pool.connection()
+    ensure_movies_schema(conn)
+    ensure_movie_indexes(conn)
+    bulk_load_movies(conn, movies)
+    print("\nSQLite Data:")
+    for row in pool.iterate(ALL_MOVIES):  # streamed, and timed in pool.stats
+        print(row)
+
+
+HANDLERS = {
+    "csv": handle_csv,
+    "json": handle_json,
+    "yaml": handle_yaml,
+    "xml": handle_xml,
+    "excel": handle_excel,
+    "zip": handle_zip,
+    "sqlite": handle_sqlite,
+}
 
 
 # --- Run All ---
 if __name__ == "__main__":
-    handle_csv()
-    handle_json()
-    handle_yaml()
-    handle_xml()
-    handle_excel()
-    handle_zip()
-    handle_sqlite()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "handlers", nargs="*",
+        help=f"Handlers to run, in order, from: {', '.join(HANDLERS)} (default: all)",
+    )
+    parser.add_argument("--startup-benchmark", action="store_true")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, help="Fail above this import time")
+    args = parser.parse_args()
+    unknown = [name for name in args.handlers if name not in HANDLERS]
+    if unknown:
+        parser.error(f"unknown handler(s): {', '.join(unknown)}")
+
+    if args.startup_benchmark:
+        from startup_timing import report_startup
+
+        ok = report_startup(__file__, args.handlers or HANDLERS, args.repeat, args.max_import_ms)
+        sys.exit(0 if ok else 1)
+    else:
+        for name in args.handlers or HANDLERS:
+            HANDLERS[name]()
@@ -0,0 +1,193 @@
+"""
+File Index Demo
+Keeps file metadata for a directory tree in SQLite. Each directory's mtime
+is stored, and later scans only re-read directories whose mtime changed,
+reusing the stored listing for the rest.
+
+A directory's mtime changes when entries are added, removed or renamed in
+it, not when an existing file is rewritten in place, so in-place edits in
+otherwise unchanged directories are picked up only by a full rescan
+(`scan(root, full=True)`).
+
+Run As : python file_index.py --files 1000000 --touch 100
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import argparse
+from collections import namedtuple
+
+from sqlite_bulk import apply_profile
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs (parent);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    dir TEXT,
+    size INTEGER,
+    mtime_ns INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_files_dir ON files (dir);
+CREATE INDEX IF NOT EXISTS idx_files_mtime ON files (mtime_ns);
+CREATE INDEX IF NOT EXISTS idx_files_size ON files (size);
+"""
+
+ScanStats = namedtuple("ScanStats", ["dirs_seen", "dirs_rescanned", "files_indexed", "seconds"])
+
+COMMIT_EVERY = 1_000  # directories per transaction
+
+
+class FileIndex:
+    """On-disk index of file paths, sizes and mtimes under one or more roots."""
+
+    def __init__(self, db_path="file_index.db", profile="fast"):
+        self.conn = sqlite3.connect(db_path)
+        apply_profile(self.conn, profile)
+        self.conn.executescript(SCHEMA)
+
+    # --- Scanning ---
+    def _children(self, path):
+        return [row[0] for row in self.conn.execute("SELECT path FROM dirs WHERE parent = ?", (path,))]
+
+    def _forget(self, path):
+        """Drop a directory and everything below it from the index."""
+        low, high = path + os.sep, path + chr(ord(os.sep) + 1)
+        self.conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, low, high))
+        self.conn.execute("DELETE FROM files WHERE path >= ? AND path < ?", (low, high))
+
+    def _rescan(self, path, mtime_ns):
+        files, subdirs = [], []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        files.append((entry.path, path, st.st_size, st.st_mtime_ns))
+                except OSError:
+                    continue  # vanished or unreadable while scanning
+
+        self.conn.execute("DELETE FROM files WHERE dir = ?", (path,))
+        self.conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?)", files)
+        for gone in set(self._children(path)) - set(subdirs):
+            self._forget(gone)
+        self.conn.execute(
+            """INSERT INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET mtime_ns = excluded.mtime_ns""",
+            (path, os.path.dirname(path), mtime_ns),
+        )
+        return subdirs, len(files)
+
+    def scan(self, root, full=False):
+        """Bring the index for `root` up to date and return ScanStats.
+
+        Every directory is stat-ed, but only new directories or those whose
+        mtime changed are listed again; `full=True` lists all of them.
+        """
+        start = time.perf_counter()
+        stored = dict(self.conn.execute("SELECT path, mtime_ns FROM dirs"))
+        seen = rescanned = indexed = 0
+        stack = [os.path.abspath(root)]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                self._forget(path)
+                continue
+            seen += 1
+            if not full and stored.get(path) == mtime_ns:
+                stack.extend(self._children(path))
+                continue
+            try:
+                subdirs, count = self._rescan(path, mtime_ns)
+            except OSError:
+                continue
+            stack.extend(subdirs)
+            rescanned += 1
+            indexed += count
+            if rescanned % COMMIT_EVERY == 0:
+                self.conn.commit()
+        self.conn.commit()
+        return ScanStats(seen, rescanned, indexed, time.perf_counter() - start)
+
+    # --- Queries ---
+    def changed_since(self, timestamp):
+        """Yield (path, size, mtime) for files modified at or after `timestamp`."""
+        cursor = self.conn.execute(
+            "SELECT path, size, mtime_ns FROM files WHERE mtime_ns >= ? ORDER BY mtime_ns",
+            (int(timestamp * 1e9),),
+        )
+        for path, size, mtime_ns in cursor:
+            yield path, size, mtime_ns / 1e9
+
+    def largest(self, n=10):
+        """The `n` largest files as (path, size), biggest first."""
+        return self.conn.execute(
+            "SELECT path, size FROM files ORDER BY size DESC LIMIT ?", (n,)
+        ).fetchall()
+
+    def file_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --- Benchmark ---
+def benchmark(files=1_000_000, touch=100):
+    """Cold scan vs warm rescans (unchanged, and with `touch` dirs changed)."""
+    from dir_walker import make_tree
+
+    tmp = tempfile.mkdtemp()
+    root = os.path.join(tmp, "tree")
+    try:
+        print(f"Creating {files:,} files ...")
+        make_tree(root, files)
+        print(f"\n--- File Index Benchmark ({files:,} files) ---")
+
+        start = time.perf_counter()
+        walked = sum(len(names) for _, _, names in os.walk(root))
+        print(f"{'os.walk (no index)':<24} {time.perf_counter() - start:>8.2f} s  {walked:,} files")
+
+        with FileIndex(os.path.join(tmp, "index.db")) as index:
+            def run(label, **kwargs):
+                stats = index.scan(root, **kwargs)
+                print(f"{label:<24} {stats.seconds:>8.2f} s  "
+                      f"{stats.dirs_rescanned:,}/{stats.dirs_seen:,} dirs listed")
+
+            run("cold scan")
+            run("warm, unchanged")
+            changed = [d for d, _, _ in os.walk(root)][-touch:]
+            for d in changed:
+                open(os.path.join(d, "new.json"), "w").close()
+            run(f"warm, {len(changed)} dirs changed")
+            run("full rescan", full=True)
+            assert index.file_count() == files + len(changed)
+    finally:
+        shutil.rmtree(tmp)
+
+
+# --- Main ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--touch", type=int, default=100)
+    args = parser.parse_args()
+    benchmark(args.files, args.touch)
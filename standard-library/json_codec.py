@@ -0,0 +1,169 @@
+"""
+JSON Serialization Demo
+One dump/load API over interchangeable backends: orjson or ujson when
+installed, the stdlib json module otherwise. Output is compact unless
+pretty printing is asked for, and large record sets stream as
+newline-delimited JSON (one record per line).
+
+Values a fast backend rejects (e.g. ints over 64 bits, or NaN when
+decoding) are retried with the stdlib, so every backend accepts what json
+does. One difference remains: orjson writes NaN and Infinity as null where
+json writes NaN/Infinity. Call set_backend("json") if those must round-trip.
+
+Run As : python json_codec.py --records 100000
+"""
+
+import json
+import time
+import argparse
+from collections import namedtuple
+
+
+Backend = namedtuple("Backend", ["name", "dumps", "loads"])
+
+BACKENDS = {}
+
+
+# --- Backends ---
+def _stdlib_dumps(obj, pretty=False):
+    if pretty:
+        return json.dumps(obj, indent=4)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+BACKENDS["json"] = Backend("json", _stdlib_dumps, json.loads)
+
+_REJECTED = (TypeError, ValueError, OverflowError)  # what fast backends raise on unsupported values
+
+
+def _with_fallback(name, fast_dumps, fast_loads):
+    def dumps(obj, pretty=False):
+        try:
+            return fast_dumps(obj, pretty)
+        except _REJECTED:
+            return _stdlib_dumps(obj, pretty)
+
+    def loads(data):
+        try:
+            return fast_loads(data)
+        except _REJECTED:
+            return json.loads(data)
+
+    return Backend(name, dumps, loads)
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+else:
+    def _ujson_dumps(obj, pretty=False):
+        return ujson.dumps(obj, indent=4 if pretty else 0, escape_forward_slashes=False)
+
+    BACKENDS["ujson"] = _with_fallback("ujson", _ujson_dumps, ujson.loads)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    def _orjson_dumps(obj, pretty=False):
+        # orjson only supports two-space indentation; non-str keys are
+        # stringified like json does ({1: "a"} -> {"1": "a"})
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option).decode()
+
+    BACKENDS["orjson"] = _with_fallback("orjson", _orjson_dumps, orjson.loads)
+
+# Fastest installed backend first
+PREFERENCE = ["orjson", "ujson", "json"]
+_default = next(name for name in PREFERENCE if name in BACKENDS)
+
+
+def available_backends():
+    return [name for name in PREFERENCE if name in BACKENDS]
+
+
+def set_backend(name):
+    """Make `name` the default backend for this process."""
+    global _default
+    if name not in BACKENDS:
+        raise ValueError(f"Backend {name!r} is not installed, choose from {available_backends()}")
+    _default = name
+
+
+def get_backend(name=None):
+    return BACKENDS[name or _default]
+
+
+# --- Documents ---
+def dumps(obj, pretty=False, backend=None):
+    return get_backend(backend).dumps(obj, pretty)
+
+
+def loads(data, backend=None):
+    return get_backend(backend).loads(data)
+
+
+def dump(obj, f, pretty=False, backend=None):
+    f.write(dumps(obj, pretty, backend))
+
+
+def load(f, backend=None):
+    return loads(f.read(), backend)
+
+
+# --- Newline-Delimited JSON ---
+def write_ndjson(path, records, backend=None):
+    """Write one compact JSON document per line; returns the record count."""
+    encode = get_backend(backend).dumps
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(encode(record))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def iter_ndjson(path, backend=None):
+    """Yield records from a newline-delimited JSON file one at a time."""
+    decode = get_backend(backend).loads
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield decode(line)
+
+
+# --- Benchmark ---
+def synthetic_records(n):
+    return [
+        {"id": i, "name": f"person_{i}", "age": 18 + i % 80, "city": "London",
+         "scores": [i % 7, i % 11, i % 13], "active": i % 2 == 0}
+        for i in range(n)
+    ]
+
+
+def benchmark(n=100_000, repeat=3):
+    """Report encode/decode MB/s for every installed backend (best of `repeat`)."""
+    records = synthetic_records(n)
+    print(f"\n--- JSON Backend Benchmark ({n:,} records) ---")
+    print(f"{'backend':>8} {'encode MB/s':>12} {'decode MB/s':>12}")
+    for name in available_backends():
+        backend = BACKENDS[name]
+        encode = decode = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = backend.dumps(records)
+            encode = min(encode, time.perf_counter() - start)
+            start = time.perf_counter()
+            backend.loads(text)
+            decode = min(decode, time.perf_counter() - start)
+        mb = len(text.encode()) / (1024 * 1024)
+        print(f"{name:>8} {mb / encode:>12.1f} {mb / decode:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+    benchmark(args.records)
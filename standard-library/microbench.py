@@ -0,0 +1,197 @@
+"""
+Micro-Benchmark Harness
+Times small callables with warmup, auto-ranged iteration counts and
+repeated runs, reports min/median/stddev per call, saves results as JSON
+and compares them against a saved baseline.
+
+Any module can take part by defining a `register_benchmarks(suite)` hook:
+
+    def register_benchmarks(suite):
+        suite.add("exceptions.if_check", parse_with_if_check)
+
+Run As : python microbench.py ../exception-handling/demo_script.py \
+             --json results.json --baseline baseline.json
+"""
+
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import argparse
+from datetime import datetime, timezone
+
+
+DEFAULT_MIN_TIME = 0.2  # seconds each timed run should last
+DEFAULT_REPEAT = 7
+DEFAULT_WARMUP = 3
+DEFAULT_THRESHOLD = 0.10  # relative median change reported as a regression
+
+
+# --- Measuring ---
+def _time_loop(func, number):
+    timer = time.perf_counter
+    start = timer()
+    for _ in range(number):
+        func()
+    return timer() - start
+
+
+def autorange(func, min_time=DEFAULT_MIN_TIME):
+    """Smallest loop count in 1, 2, 5, 10, 20, 50, ... taking >= min_time."""
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = scale * multiplier
+            if _time_loop(func, number) >= min_time:
+                return number
+        scale *= 10
+
+
+def measure(func, repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME,
+            warmup=DEFAULT_WARMUP, number=None):
+    """Time `func()` and return per-call statistics in seconds.
+
+    After `warmup` untimed calls, the loop count is auto-ranged so each of
+    the `repeat` timed runs lasts at least `min_time` (unless `number` is
+    given).
+    """
+    for _ in range(warmup):
+        func()
+    number = number or autorange(func, min_time)
+    per_call = [_time_loop(func, number) / number for _ in range(repeat)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(per_call),
+        "median": statistics.median(per_call),
+        "stddev": statistics.stdev(per_call) if repeat > 1 else 0.0,
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+# --- Suites ---
+class Suite:
+    """A named collection of zero-argument callables to benchmark."""
+
+    def __init__(self):
+        self.benchmarks = {}
+
+    def add(self, name, func):
+        if name in self.benchmarks:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        self.benchmarks[name] = func
+
+    def register(self, name):
+        """Decorator form of add()."""
+        def decorator(func):
+            self.add(name, func)
+            return func
+        return decorator
+
+    def load(self, path):
+        """Import the module at `path` and call its register_benchmarks hook."""
+        path = os.path.abspath(path)
+        module_name = "_bench_" + os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.path.insert(0, os.path.dirname(path))  # for the module's own sibling imports
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.path.remove(os.path.dirname(path))
+        if not hasattr(module, "register_benchmarks"):
+            raise ValueError(f"{path} does not define register_benchmarks(suite)")
+        module.register_benchmarks(self)
+
+    def run(self, pattern=None, report=True, **measure_kwargs):
+        """Measure every benchmark whose name contains `pattern`."""
+        results = {}
+        for name, func in self.benchmarks.items():
+            if pattern and pattern not in name:
+                continue
+            results[name] = stats = measure(func, **measure_kwargs)
+            if report:
+                print(f"{name:<40} median {format_time(stats['median']):>12}  "
+                      f"min {format_time(stats['min']):>12}  "
+                      f"stddev {format_time(stats['stddev']):>12}  "
+                      f"({stats['repeat']} x {stats['number']:,})")
+        return results
+
+
+# --- Results ---
+def save_results(results, path):
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare medians with a baseline; returns {name: (ratio, verdict)}.
+
+    ratio is new/baseline, so above 1 means slower. Changes within
+    `threshold` count as "same".
+    """
+    comparison = {}
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        ratio = stats["median"] / baseline[name]["median"]
+        if ratio > 1 + threshold:
+            verdict = "slower"
+        elif ratio < 1 - threshold:
+            verdict = "faster"
+        else:
+            verdict = "same"
+        comparison[name] = (ratio, verdict)
+    return comparison
+
+
+def report_comparison(comparison):
+    for name, (ratio, verdict) in comparison.items():
+        print(f"{name:<40} {ratio:>6.2f}x baseline  {verdict}")
+
+
+# --- Main ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("modules", nargs="+", help="Files defining register_benchmarks(suite)")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--baseline", help="Compare against results saved earlier")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    suite = Suite()
+    for path in args.modules:
+        suite.load(path)
+    results = suite.run(args.filter, repeat=args.repeat, min_time=args.min_time)
+
+    if args.json:
+        save_results(results, args.json)
+    if args.baseline:
+        comparison = compare(results, load_results(args.baseline), args.threshold)
+        print("\n--- Baseline Comparison ---")
+        report_comparison(comparison)
+        if any(verdict == "slower" for _, verdict in comparison.values()):
+            sys.exit(1)
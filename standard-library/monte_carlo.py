@@ -0,0 +1,138 @@
+"""
+Monte Carlo Demo
+Estimates π by sampling points in the unit square, vectorized with NumPy
+in fixed-size batches. The parallel mode gives each worker process its own
+independent, reproducible random stream spawned from one seed.
+
+Run As : python monte_carlo.py --samples 1000000 10000000 100000000 1000000000
+"""
+
+import math
+import os
+import random
+import time
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+DEFAULT_SEED = 42
+DEFAULT_BATCH_SIZE = 1_000_000
+
+Estimate = namedtuple("Estimate", ["samples", "pi", "stderr"])
+
+
+def _check(samples, batch_size=1):
+    if samples <= 0:
+        raise ValueError(f"samples must be positive, got {samples}")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+
+def _estimate(inside, samples):
+    """π estimate and its standard error from `inside` hits out of `samples`."""
+    p = inside / samples
+    return Estimate(samples, 4 * p, 4 * math.sqrt(p * (1 - p) / samples))
+
+
+# --- Pure Python Baseline ---
+def estimate_pi_loop(samples, seed=DEFAULT_SEED):
+    """The original randomness_demo loop, one random.random() pair at a time."""
+    _check(samples)
+    rng = random.Random(seed)
+    inside = 0
+    for _ in range(samples):
+        x, y = rng.random(), rng.random()
+        if x**2 + y**2 <= 1:
+            inside += 1
+    return _estimate(inside, samples)
+
+
+# --- Vectorized Sampler ---
+def _count_inside(rng, samples, batch_size):
+    inside = 0
+    remaining = samples
+    while remaining:
+        n = min(batch_size, remaining)
+        x = rng.random(n)
+        y = rng.random(n)
+        inside += int(np.count_nonzero(x * x + y * y <= 1.0))
+        remaining -= n
+    return inside
+
+
+def iter_pi_estimates(samples, batch_size=DEFAULT_BATCH_SIZE, seed=DEFAULT_SEED):
+    """Yield a running Estimate after every batch, to watch convergence."""
+    _check(samples, batch_size)
+    rng = np.random.default_rng(seed)
+    inside = drawn = 0
+    while drawn < samples:
+        n = min(batch_size, samples - drawn)
+        inside += _count_inside(rng, n, n)
+        drawn += n
+        yield _estimate(inside, drawn)
+
+
+def estimate_pi(samples, batch_size=DEFAULT_BATCH_SIZE, seed=DEFAULT_SEED):
+    """Vectorized estimate; memory is bounded by `batch_size`, not `samples`."""
+    _check(samples, batch_size)
+    rng = np.random.default_rng(seed)
+    return _estimate(_count_inside(rng, samples, batch_size), samples)
+
+
+# --- Multi-Process Sampler ---
+def _worker_count(seed_seq, samples, batch_size):
+    return _count_inside(np.random.default_rng(seed_seq), samples, batch_size)
+
+
+def estimate_pi_parallel(samples, workers=None, batch_size=DEFAULT_BATCH_SIZE,
+                         seed=DEFAULT_SEED):
+    """Split `samples` across `workers` processes with independent streams.
+
+    Streams are spawned from SeedSequence(seed), so the same seed and worker
+    count always give the same estimate, whatever the scheduling order.
+    """
+    _check(samples, batch_size)
+    workers = workers or os.cpu_count() or 1
+    streams = np.random.SeedSequence(seed).spawn(workers)
+    shares = [samples // workers + (i < samples % workers) for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = pool.map(_worker_count, streams, shares, [batch_size] * workers)
+        return _estimate(sum(counts), samples)
+
+
+# --- Benchmark ---
+def _rate(fn, samples):
+    start = time.perf_counter()
+    result = fn(samples)
+    return samples / (time.perf_counter() - start), result
+
+
+def benchmark(sizes=(10**6, 10**7, 10**8, 10**9), workers=None, loop_cap=10**7):
+    """Report samples/sec for the loop, vectorized and parallel samplers.
+
+    The pure Python loop is timed on at most `loop_cap` samples, since its
+    rate does not depend on the total.
+    """
+    workers = workers or os.cpu_count() or 1
+    print(f"\n--- Monte Carlo π Benchmark ({workers} workers) ---")
+    print(f"{'samples':>15} {'sampler':>10} {'samples/sec':>14} {'π':>10} {'stderr':>10}")
+    for n in sizes:
+        runs = [
+            ("loop", estimate_pi_loop, min(n, loop_cap)),
+            ("numpy", estimate_pi, n),
+            ("parallel", lambda s: estimate_pi_parallel(s, workers), n),
+        ]
+        for label, fn, samples in runs:
+            rate, est = _rate(fn, samples)
+            print(f"{n:>15,} {label:>10} {rate:>14,.0f} {est.pi:>10.6f} {est.stderr:>10.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, nargs="+", default=[10**6, 10**7, 10**8, 10**9])
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+    benchmark(args.samples, args.workers)
@@ -0,0 +1,133 @@
+"""
+Movies Query Layer Demo
+Indexed year/title lookups over the Movies table. Results stream through
+fetchmany-sized cursors, and EXPLAIN QUERY PLAN checks guard against
+silently regressing to full table scans.
+"""
+
+import sqlite3
+
+
+DEFAULT_FETCH_SIZE = 1_000
+
+MOVIE_INDEXES = {
+    "idx_movies_year": "CREATE INDEX IF NOT EXISTS idx_movies_year ON Movies (year)",
+    "idx_movies_title": "CREATE INDEX IF NOT EXISTS idx_movies_title ON Movies (title)",
+}
+
+ALL_MOVIES = "SELECT id, title, year FROM Movies"
+BY_YEAR = "SELECT id, title, year FROM Movies WHERE year = ?"
+YEAR_RANGE = "SELECT id, title, year FROM Movies WHERE year BETWEEN ? AND ? ORDER BY year"
+BY_TITLE = "SELECT id, title, year FROM Movies WHERE title = ?"
+# Also serves prefix search: LIKE 'x%' only uses an index under NOCASE
+# collation, so prefixes become a half-open range on the BINARY index
+TITLE_RANGE = "SELECT id, title, year FROM Movies WHERE title >= ? AND title < ? ORDER BY title"
+TITLE_FROM = "SELECT id, title, year FROM Movies WHERE title >= ? ORDER BY title"
+
+# Every query, a representative parameter set and the index it must use
+QUERY_PLANS = {
+    "by_year": (BY_YEAR, (2010,), "idx_movies_year"),
+    "year_range": (YEAR_RANGE, (2000, 2010), "idx_movies_year"),
+    "by_title": (BY_TITLE, ("Inception",), "idx_movies_title"),
+    "title_range": (TITLE_RANGE, ("A", "M"), "idx_movies_title"),
+    "title_from": (TITLE_FROM, ("M",), "idx_movies_title"),
+}
+
+
+# --- Setup ---
+def ensure_movie_indexes(conn):
+    with conn:
+        for ddl in MOVIE_INDEXES.values():
+            conn.execute(ddl)
+
+
+# --- Streaming Reads ---
+def _stream(cursor, size):
+    while rows := cursor.fetchmany(size):
+        yield from rows
+
+
+def iter_movies(conn, size=DEFAULT_FETCH_SIZE):
+    """Stream every movie without materializing the whole table."""
+    return _stream(conn.execute(ALL_MOVIES), size)
+
+
+def movies_by_year(conn, year, size=DEFAULT_FETCH_SIZE):
+    return _stream(conn.execute(BY_YEAR, (year,)), size)
+
+
+def movies_in_years(conn, first, last, size=DEFAULT_FETCH_SIZE):
+    """Movies released between `first` and `last` inclusive, by year."""
+    return _stream(conn.execute(YEAR_RANGE, (first, last)), size)
+
+
+def movies_by_title(conn, title, size=DEFAULT_FETCH_SIZE):
+    return _stream(conn.execute(BY_TITLE, (title,)), size)
+
+
+def _prefix_upper_bound(prefix):
+    """Smallest string greater than every string starting with `prefix`.
+
+    Returns None when there is none, i.e. the prefix is all U+10FFFF.
+    """
+    for i in range(len(prefix) - 1, -1, -1):
+        code = ord(prefix[i]) + 1
+        if code > 0x10FFFF:  # no next character: carry into the one before
+            continue
+        if 0xD800 <= code <= 0xDFFF:  # surrogates cannot be encoded, so skip past them
+            code = 0xE000
+        return prefix[:i] + chr(code)
+    return None
+
+
+def movies_with_title_prefix(conn, prefix, size=DEFAULT_FETCH_SIZE):
+    """Case-sensitive title prefix search, in title order."""
+    if not prefix:
+        return iter_movies(conn, size)
+    upper = _prefix_upper_bound(prefix)
+    if upper is None:
+        return _stream(conn.execute(TITLE_FROM, (prefix,)), size)
+    return _stream(conn.execute(TITLE_RANGE, (prefix, upper)), size)
+
+
+def movies_in_title_range(conn, low, high, size=DEFAULT_FETCH_SIZE):
+    """Titles with low <= title < high, in title order."""
+    return _stream(conn.execute(TITLE_RANGE, (low, high)), size)
+
+
+# --- Query Plan Checks ---
+def query_plan(conn, sql, params=()):
+    """Return the `detail` column of EXPLAIN QUERY PLAN for `sql`."""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def assert_uses_index(conn, sql, params, index):
+    """Fail if `sql` does not search Movies through `index`."""
+    plan = query_plan(conn, sql, params)
+    if not any(f"INDEX {index}" in step for step in plan):
+        raise AssertionError(f"Expected {index} in plan {plan} for: {sql}")
+    if any(step.startswith("SCAN Movies") for step in plan):
+        raise AssertionError(f"Full table scan in plan {plan} for: {sql}")
+
+
+def check_query_plans(conn):
+    """Assert that every query in QUERY_PLANS uses its index."""
+    for sql, params, index in QUERY_PLANS.values():
+        assert_uses_index(conn, sql, params, index)
+
+
+# --- Demo ---
+if __name__ == "__main__":
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE Movies (id INTEGER PRIMARY KEY, title TEXT, year INTEGER)")
+    conn.executemany(
+        "INSERT INTO Movies VALUES (?, ?, ?)",
+        [(1, "Inception", 2010), (2, "Interstellar", 2014), (3, "Memento", 2000)],
+    )
+    ensure_movie_indexes(conn)
+    check_query_plans(conn)
+    print("Query plans OK:", ", ".join(QUERY_PLANS))
+
+    print("Released 2005-2015:", list(movies_in_years(conn, 2005, 2015)))
+    print("Titles starting 'Inte':", list(movies_with_title_prefix(conn, "Inte")))
+    print("Released in 2000:", list(movies_by_year(conn, 2000)))
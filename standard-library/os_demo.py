@@ -24,7 +24,8 @@ print("Normalized Path:", os.path.normpath(messy_path))  # Cleans up the path
 
 # --- Working with Directories ---
 print("\n--- Directory Operations ---")
-print("Listing Current Directory:", os.listdir("."))  # Lists files in the current directory
+with os.scandir(".") as entries:  # Like os.listdir, but yields DirEntry objects with cached type info
+    print("Listing Current Directory:", [entry.name for entry in entries])
 
 # Create and remove directories (commented to avoid accidental changes)
 # os.mkdir("new_directory")  # Creates a new directory
@@ -50,8 +51,21 @@ os.system("echo Hello, World!")  # Executes a system command (prints "Hello, Wor
 
 # --- Walking Through Directory Tree ---
 print("\n--- Directory Tree Walk ---")
-for root, dirs, files in os.walk("."):
-    print("Root:", root)
-    print("Directories:", dirs)
-    print("Files:", files)
-    break  # Only show the first level to keep output short
+from dir_walker import walk_entries, entry_size  # scandir-based, multi-threaded walker
+
+for i, entry in enumerate(walk_entries(".", include=["*.py"], exclude=["__pycache__", ".git"])):
+    print("File:", entry.path, "Size:", entry_size(entry))  # stat result is cached on the entry
+    if i == 4:
+        break  # Only show a few files to keep output short
+
+# --- Incremental File Index ---
+print("\n--- Incremental File Index ---")
+import tempfile
+from file_index import FileIndex  # SQLite-backed; reruns only re-list changed directories
+
+# Kept in the temp directory, so the index (and its -wal/-shm files) never
+# lands in the tree it scans, yet survives between runs
+with FileIndex(os.path.join(tempfile.gettempdir(), "os_demo_file_index.db")) as index:
+    stats = index.scan(".")
+    print(f"Listed {stats.dirs_rescanned} of {stats.dirs_seen} directories")
+    print("Largest files:", index.largest(3))
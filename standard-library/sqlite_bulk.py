@@ -0,0 +1,172 @@
+"""
+SQLite Bulk Loading Demo
+Loads Movies records from any iterable in size-bounded transactions, with
+opt-in PRAGMA profiles and a real primary key so upserts deduplicate.
+
+Run As : python sqlite_bulk.py --rows 1000000 --batch-size 50000
+"""
+
+import os
+import sqlite3
+import time
+import argparse
+from collections.abc import Mapping
+from itertools import islice
+
+
+DEFAULT_BATCH_SIZE = 50_000
+
+MOVIES_SCHEMA = """CREATE TABLE IF NOT EXISTS Movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    year INTEGER
+)"""
+
+UPSERT_MOVIE = """INSERT INTO Movies (id, title, year) VALUES (?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET title = excluded.title, year = excluded.year"""
+
+# PRAGMA profiles, applied in order. "default" leaves SQLite untouched.
+# "fast" keeps durability across application crashes (WAL + NORMAL), while
+# "unsafe" trades crash safety for raw speed and suits throwaway loads only.
+PROFILES = {
+    "default": {},
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,  # negative means KiB, i.e. ~64 MB
+        "temp_store": "MEMORY",
+    },
+    "unsafe": {
+        "journal_mode": "OFF",
+        "synchronous": "OFF",
+        "cache_size": -256_000,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+# --- Connection Setup ---
+def apply_profile(conn, profile="default"):
+    """Apply one of the PROFILES to an open connection."""
+    try:
+        pragmas = PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown profile {profile!r}, choose from {list(PROFILES)}")
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def ensure_movies_schema(conn):
+    """Create Movies with an `id` primary key, migrating an old key-less table.
+
+    Older demo databases created Movies without a primary key, so
+    `INSERT OR REPLACE` never deduplicated. Those rows are copied over,
+    keeping the last row seen for each id.
+    """
+    columns = conn.execute("PRAGMA table_info(Movies)").fetchall()
+    if columns and not any(col[5] for col in columns):  # col[5] is the pk flag
+        # sqlite3 only opens transactions implicitly before DML, so the DDL
+        # below would autocommit; an explicit savepoint makes it all-or-nothing
+        conn.execute("SAVEPOINT migrate_movies")
+        try:
+            conn.execute("ALTER TABLE Movies RENAME TO Movies_old")
+            conn.execute(MOVIES_SCHEMA)
+            conn.execute(
+                """INSERT INTO Movies (id, title, year)
+                   SELECT id, title, year FROM Movies_old
+                   WHERE rowid IN (SELECT MAX(rowid) FROM Movies_old GROUP BY id)"""
+            )
+            conn.execute("DROP TABLE Movies_old")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO migrate_movies")
+            conn.execute("RELEASE migrate_movies")
+            raise
+        conn.execute("RELEASE migrate_movies")  # commits, unless nested in a caller's transaction
+    else:
+        conn.execute(MOVIES_SCHEMA)
+
+
+# --- Bulk Loading ---
+def _as_row(record):
+    if isinstance(record, Mapping):
+        return record["id"], record["title"], record["year"]
+    return tuple(record)
+
+
+def bulk_load_movies(conn, records, batch_size=DEFAULT_BATCH_SIZE):
+    """Upsert Movies records from any iterable, one transaction per batch.
+
+    Records may be mappings with id/title/year keys or (id, title, year)
+    sequences. Only one batch is materialized at a time. Returns the number
+    of records processed.
+    """
+    rows = map(_as_row, records)
+    loaded = 0
+    while batch := list(islice(rows, batch_size)):
+        with conn:  # commits the batch, or rolls it back on error
+            conn.executemany(UPSERT_MOVIE, batch)
+        loaded += len(batch)
+    return loaded
+
+
+# --- Benchmark ---
+def synthetic_movies(n):
+    for i in range(n):
+        yield {"id": i, "title": f"Movie {i}", "year": 1950 + i % 75}
+
+
+def _legacy_load(path, n):
+    """The original handle_sqlite path: full tuple list, no primary key."""
+    movies = list(synthetic_movies(n))
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS Movies (id INTEGER, title TEXT, year INTEGER)"""
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO Movies VALUES (?, ?, ?)",
+            [tuple(m.values()) for m in movies],
+        )
+        conn.commit()
+    conn.close()
+
+
+def _bulk_load(path, n, profile, batch_size):
+    conn = sqlite3.connect(path)
+    try:
+        apply_profile(conn, profile)
+        ensure_movies_schema(conn)
+        bulk_load_movies(conn, synthetic_movies(n), batch_size)
+    finally:
+        conn.close()
+
+
+def _remove_db(path):
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def benchmark(n=1_000_000, batch_size=DEFAULT_BATCH_SIZE, path="movies_bench.db"):
+    """Compare inserts/sec of the original path against each bulk profile."""
+    print(f"\n--- SQLite Bulk Load Benchmark ({n:,} rows, batch_size={batch_size}) ---")
+    runs = [("legacy executemany", lambda: _legacy_load(path, n))]
+    for profile in PROFILES:
+        runs.append(
+            (f"bulk [{profile}]", lambda p=profile: _bulk_load(path, n, p, batch_size))
+        )
+
+    for label, run in runs:
+        _remove_db(path)
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<22} {n / elapsed:>12,.0f} inserts/sec ({elapsed:.2f} s)")
+    _remove_db(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    benchmark(args.rows, args.batch_size)
@@ -0,0 +1,206 @@
+"""
+SQLite Connection Pool Demo
+Reuses one connection per thread, keeps a bounded LRU of prepared
+statements per connection, runs queries on a worker pool for async callers
+and records per-query latency percentiles.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlite_bulk import apply_profile
+
+
+# --- Latency Counters ---
+class LatencyStats:
+    """Per-query latency samples, bounded to the most recent `window` runs."""
+
+    def __init__(self, window=10_000):
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._counts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, sql, seconds):
+        with self._lock:
+            self._samples[sql].append(seconds)
+            self._counts[sql] += 1
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+    def summary(self):
+        """Return {sql: {"count", "p50_ms", "p99_ms"}} for every query seen."""
+        with self._lock:
+            snapshot = {sql: sorted(s) for sql, s in self._samples.items()}
+            counts = dict(self._counts)
+        return {
+            sql: {
+                "count": counts[sql],
+                "p50_ms": self._percentile(ordered, 50) * 1000,
+                "p99_ms": self._percentile(ordered, 99) * 1000,
+            }
+            for sql, ordered in snapshot.items()
+        }
+
+    def report(self):
+        for sql, s in self.summary().items():
+            print(f"{s['count']:>8} runs  p50 {s['p50_ms']:.3f} ms  "
+                  f"p99 {s['p99_ms']:.3f} ms  {' '.join(sql.split())[:60]}")
+
+
+# --- Connection Pool ---
+class ConnectionPool:
+    """Thread-safe pool that hands each thread its own long-lived connection.
+
+    sqlite3 keeps an LRU cache of prepared statements per connection;
+    `max_statements` bounds it, so repeated SQL text skips re-parsing as
+    long as the same connection is reused.
+    """
+
+    def __init__(self, path, max_statements=256, profile="default", workers=4):
+        self.path = path
+        self.max_statements = max_statements
+        self.profile = profile
+        self.stats = LatencyStats()
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sqlite-pool"
+        )
+        self._closed = False
+
+    def connection(self):
+        """Return the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._closed:
+                raise RuntimeError("ConnectionPool is closed")
+            conn = sqlite3.connect(
+                self.path,
+                cached_statements=self.max_statements,
+                check_same_thread=False,  # close() may run on another thread
+            )
+            apply_profile(conn, self.profile)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def execute(self, sql, params=(), size=None):
+        """Run `sql` on this thread's connection and return its rows.
+
+        `size` limits the result to the first `size` rows via fetchmany.
+        """
+        conn = self.connection()
+        start = time.perf_counter()
+        cursor = conn.execute(sql, params)
+        rows = cursor.fetchall() if size is None else cursor.fetchmany(size)
+        self.stats.record(sql, time.perf_counter() - start)
+        return rows
+
+    def iterate(self, sql, params=(), size=1_000):
+        """Yield the rows of `sql`, fetching `size` at a time.
+
+        Only the time spent inside SQLite is recorded, once the rows run out
+        or the iterator is closed.
+        """
+        conn = self.connection()
+        start = time.perf_counter()
+        cursor = conn.execute(sql, params)
+        elapsed = time.perf_counter() - start
+        try:
+            while True:
+                start = time.perf_counter()
+                rows = cursor.fetchmany(size)
+                elapsed += time.perf_counter() - start
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            self.stats.record(sql, elapsed)
+
+    def submit(self, sql, params=(), size=None):
+        """Run a query on the worker pool, returning a concurrent Future."""
+        return self._executor.submit(self.execute, sql, params, size)
+
+    async def query(self, sql, params=(), size=None):
+        """Await a query without blocking the event loop."""
+        import asyncio  # already loaded by any caller that can await; ~70 ms for those that don't
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.execute, sql, params, size
+        )
+
+    def close(self):
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path, max_statements=256, profile="default", workers=4):
+    """Return a process-wide shared pool for `path`, creating it once.
+
+    Pools are shared per (path, settings), so asking for a different
+    profile or cache size never silently returns a pool configured otherwise.
+    """
+    key = (path, max_statements, profile, workers)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(path, max_statements, profile, workers)
+        return _pools[key]
+
+
+# --- Demo ---
+async def _async_demo(pool):
+    import asyncio
+
+    queries = [
+        pool.query("SELECT title FROM Movies WHERE year >= ?", (year,))
+        for year in range(2000, 2020)
+    ]
+    results = await asyncio.gather(*queries)
+    print("Async query result sizes:", [len(r) for r in results])
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    with ConnectionPool(":memory:") as pool:
+        conn = pool.connection()
+        conn.execute("CREATE TABLE Movies (id INTEGER PRIMARY KEY, title TEXT, year INTEGER)")
+        conn.executemany(
+            "INSERT INTO Movies VALUES (?, ?, ?)",
+            [(1, "Inception", 2010), (2, "Interstellar", 2014)],
+        )
+        conn.commit()
+        for _ in range(1000):
+            pool.execute("SELECT * FROM Movies WHERE id = ?", (1,))
+        pool.stats.report()
+
+    # Worker threads get their own connections, so share a file database
+    with ConnectionPool("pool_demo.db") as pool:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS Movies (id INTEGER PRIMARY KEY, title TEXT, year INTEGER)")
+            conn.execute("INSERT OR REPLACE INTO Movies VALUES (1, 'Inception', 2010)")
+        asyncio.run(_async_demo(pool))
+        pool.stats.report()
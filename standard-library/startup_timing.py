@@ -0,0 +1,68 @@
+"""
+Startup Timing Helpers
+Measures cold-start cost of a script by running it in fresh interpreters
+under `python -X importtime`.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def top_level_import_us(importtime_log):
+    """Sum the cumulative microseconds of top-level `-X importtime` entries."""
+    total = 0
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):  # nested imports are indented
+            total += int(cumulative)
+    return total
+
+
+def measure_startup(script, args, repeat=5):
+    """Run `script args` `repeat` times, each in a fresh interpreter and cwd.
+
+    Returns (best wall ms, best import ms). Raises RuntimeError with the
+    last stderr line if the script fails.
+    """
+    script = os.path.abspath(script)
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(script))
+    best_wall = best_imports = float("inf")
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cwd:
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", script, *args],
+                cwd=cwd, env=env, capture_output=True, text=True,
+            )
+            wall = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        best_wall = min(best_wall, wall)
+        best_imports = min(best_imports, top_level_import_us(result.stderr))
+    return best_wall * 1000, best_imports / 1000
+
+
+def report_startup(script, commands, repeat=5, max_import_ms=None):
+    """Print startup cost per command; return False if any run failed or
+    spent more than `max_import_ms` importing."""
+    print("\n--- Startup Benchmark ---")
+    print(f"{'command':>12} {'wall ms':>9} {'imports ms':>11}")
+    ok = True
+    for name in commands:
+        try:
+            wall_ms, import_ms = measure_startup(script, [name], repeat)
+        except RuntimeError as ex:
+            print(f"{name:>12} failed: {ex}")
+            ok = False
+            continue
+        flag = ""
+        if max_import_ms is not None and import_ms > max_import_ms:
+            flag = f"  over budget ({max_import_ms} ms)"
+            ok = False
+        print(f"{name:>12} {wall_ms:>9.1f} {import_ms:>11.1f}{flag}")
+    return ok
@@ -2,20 +2,20 @@
 Python Utilities Demo Script
 Demonstrates usage of time, randomness, templating, configs, and subprocess.
 
-Run As : python script.py --config config.json --epochs 10
+Each subcommand imports only what it needs, so e.g. `time` never loads
+numpy or torch.
+
+Run As : python time_randomness_demo.py                      # every demo
+         python time_randomness_demo.py random                # one demo
+         python time_randomness_demo.py --config config.json --epochs 10 args
+         python time_randomness_demo.py --startup-benchmark [--max-import-ms 100]
 """
 
 import time
 from datetime import datetime, timedelta
 import random
-import numpy as np
-import pandas as pd
-import torch
-from string import Template
-import json
-import xml.etree.ElementTree as ET
 import argparse
-import subprocess
+import sys
 
 
 # --- Time Handling ---
@@ -24,10 +24,12 @@ def time_demo():
     print("Current timestamp:", time.time())
     print("Current datetime:", datetime.now())
 
-    start = time.perf_counter()
-    time.sleep(1)
-    end = time.perf_counter()
-    print(f"Elapsed (sleep): {end - start:.4f} sec")
+    # Time real work instead of a sleep: warmed up, auto-ranged, repeated
+    from microbench import measure, format_time
+
+    stats = measure(datetime.now, repeat=5, min_time=0.05)
+    print(f"datetime.now(): median {format_time(stats['median'])}, "
+          f"stddev {format_time(stats['stddev'])}")
 
     dt = datetime.now() + timedelta(days=5)
     print("+5 days:", dt.strftime("%Y-%m-%d"))
@@ -35,10 +37,18 @@ def time_demo():
 
 # --- Randomness ---
 def randomness_demo():
+    import numpy as np
+
+    try:
+        import torch  # optional, and by far the slowest import here
+    except ImportError:
+        torch = None
+
     print("\n--- Randomness Demo ---")
     random.seed(42)
     np.random.seed(42)
-    torch.manual_seed(42)
+    if torch is not None:
+        torch.manual_seed(42)
 
     print("Random int:", random.randint(1, 10))
     print("Random choice:", random.choice(["apple", "banana", "cherry"]))
@@ -48,36 +58,44 @@ def randomness_demo():
     print("Shuffled:", nums)
 
     print("Numpy random:", np.random.rand(2, 2))
-    print("Torch random:", torch.rand(2, 2))
+    if torch is not None:
+        print("Torch random:", torch.rand(2, 2))
+
+    # Monte Carlo estimate of π, vectorized and seeded like the rest
+    from monte_carlo import estimate_pi
 
-    # Monte Carlo estimate of π
-    inside = 0
-    total = 10000
-    for _ in range(total):
-        x, y = random.random(), random.random()
-        if x**2 + y**2 <= 1:
-            inside += 1
-    print("Estimated π:", 4 * inside / total)
+    estimate = estimate_pi(1_000_000, seed=42)
+    print(f"Estimated π: {estimate.pi:.5f} ± {estimate.stderr:.5f}")
 
 
 # --- Templating ---
 def templating_demo():
+    from template_render import get_template, render_many
+
     print("\n--- Templating Demo ---")
-    template = Template("Hello $name, your order #$order has shipped.")
-    print(template.substitute({"name": "Alice", "order": "12345"}))
+    source = "Hello $name, your order #$order has shipped."
+    template = get_template(source)  # compiled once, cached by source
+    print(template.render({"name": "Alice", "order": "12345"}))
+
+    orders = [{"name": "Bob", "order": "12346"}, {"name": "Carol", "order": "12347"}]
+    render_many(source, orders, sys.stdout)
 
 
 # --- Config Handling ---
 def config_demo(json_path="config.json", xml_path="config.xml"):
+    import xml.etree.ElementTree as ET
+    import json_codec
+    from xml_streaming import iter_elements
+
     print("\n--- Config Demo ---")
 
     # JSON
     config_data = {"version": 1.0, "debug": True}
     with open(json_path, "w") as f:
-        json.dump(config_data, f)
+        json_codec.dump(config_data, f)
 
     with open(json_path, "r") as f:
-        config = json.load(f)
+        config = json_codec.load(f)
     print("JSON Config:", config)
 
     # XML
@@ -87,43 +105,78 @@ def config_demo(json_path="config.json", xml_path="config.xml"):
     tree = ET.ElementTree(root)
     tree.write(xml_path)
 
-    tree = ET.parse(xml_path)
-    for child in tree.getroot():
+    for child in iter_elements(xml_path):
         print(f"{child.tag}: {child.text}")
 
 
-# --- Argparse Demo ---
-def argparse_demo():
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        "--config", type=str, help="Path to config file", default="config.json"
+# --- Subprocess Demo ---
+def subprocess_demo():
+    from async_subprocess import execute
+
+    print("\n--- Subprocess Demo ---")
+    commands = [["echo", f"Hello from subprocess {i}"] for i in range(3)]
+    results, summary = execute(
+        commands,
+        concurrency=2,
+        timeout=5,
+        on_line=lambda args, stream, line: print(f"{stream.upper()}:", line),
     )
-    parser.add_argument("--epochs", type=int, default=5)
-    args = parser.parse_args()
+    print("Exit Codes:", [r.returncode for r in results])
+    print("Summary:", summary)
+
+
+# --- Argparse Demo ---
+def args_demo(args):
+    import json_codec
 
     print("\n--- Argparse Demo ---")
     print("Epochs:", args.epochs)
     with open(args.config) as f:
-        cfg = json.load(f)
+        cfg = json_codec.load(f)
         print("Loaded config:", cfg)
 
 
-# --- Subprocess Demo ---
-def subprocess_demo():
-    print("\n--- Subprocess Demo ---")
-    result = subprocess.run(
-        ["echo", "Hello from subprocess"], capture_output=True, text=True
+COMMANDS = {
+    "time": lambda args: time_demo(),
+    "random": lambda args: randomness_demo(),
+    "template": lambda args: templating_demo(),
+    "config": lambda args: config_demo(json_path=args.config),
+    "subprocess": lambda args: subprocess_demo(),
+    "args": args_demo,
+}
+
+# Subcommands run when none is given, i.e. the original script behaviour
+DEFAULT_COMMANDS = ["time", "random", "template", "config", "subprocess"]
+
+
+def argparse_demo(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--config", type=str, help="Path to config file", default="config.json"
+    )
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument(
+        "--startup-benchmark", action="store_true",
+        help="Time a cold start of each subcommand instead of running it",
     )
-    print("STDOUT:", result.stdout.strip())
-    print("Exit Code:", result.returncode)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, help="Fail above this import time")
+    subparsers = parser.add_subparsers(dest="command")
+    for name in COMMANDS:
+        subparsers.add_parser(name)
+    return parser.parse_args(argv)
 
 
 # --- Main ---
 if __name__ == "__main__":
-    time_demo()
-    randomness_demo()
-    templating_demo()
-    config_demo()
-    subprocess_demo()
+    args = argparse_demo()
+
+    if args.startup_benchmark:
+        from startup_timing import report_startup
+
+        commands = [args.command] if args.command else DEFAULT_COMMANDS
+        ok = report_startup(__file__, commands, args.repeat, args.max_import_ms)
+        sys.exit(0 if ok else 1)
 
-    # For argparse_demo() - run as a separate script from CLI to see arg parsing in action
+    for name in [args.command] if args.command else DEFAULT_COMMANDS:
+        COMMANDS[name](args)
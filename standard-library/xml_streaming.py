@@ -0,0 +1,151 @@
+"""
+Streaming XML Demo
+Reads record-oriented XML (e.g. People/Person) incrementally with
+iterparse, discarding each record once it has been handled, and writes it
+back out element by element, so memory stays flat as files grow.
+
+Run As : python xml_streaming.py --records 100000 1000000
+"""
+
+import os
+import tempfile
+import time
+import argparse
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import XMLGenerator
+
+
+# --- Reading ---
+def iter_elements(path, tag=None):
+    """Yield each direct child of the root element, then discard it.
+
+    Only the record currently being yielded is kept in memory; `tag`
+    restricts the output to children with that tag.
+    """
+    context = ET.iterparse(path, events=("start", "end"))
+    _, root = next(context)
+    depth = 0
+    for event, elem in context:
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            if tag is None or elem.tag == tag:
+                yield elem
+            root.clear()  # drop the finished record and anything before it
+
+
+def iter_records(path, tag="Person"):
+    """Yield each `tag` record as a {child tag: text} dict."""
+    for elem in iter_elements(path, tag):
+        yield {child.tag: child.text for child in elem}
+
+
+# --- Writing ---
+class XMLRecordWriter:
+    """Write flat records as <root><record><field>..</field></record>...</root>.
+
+    Each record is written as soon as it is passed in, so nothing but the
+    current record is held in memory. Records go to a temporary file next to
+    `path`, which replaces `path` only on a clean exit, so an error never
+    leaves a partial document that looks complete.
+    """
+
+    def __init__(self, path, root_tag="People", record_tag="Person"):
+        self.path = path
+        self.root_tag = root_tag
+        self.record_tag = record_tag
+        self._file = None
+        self._xml = None
+        self._tmp_path = None
+
+    def __enter__(self):
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+        self._xml = XMLGenerator(self._file, encoding="utf-8", short_empty_elements=True)
+        self._xml.startDocument()
+        self._xml.startElement(self.root_tag, {})
+        return self
+
+    def write(self, record):
+        xml = self._xml
+        xml.startElement(self.record_tag, {})
+        for field, value in record.items():
+            xml.startElement(field, {})
+            if value is not None:
+                xml.characters(str(value))
+            xml.endElement(field)
+        xml.endElement(self.record_tag)
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is not None:
+            self._file.close()
+            os.remove(self._tmp_path)
+            return
+        self._xml.endElement(self.root_tag)
+        self._xml.endDocument()
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+
+def write_records(path, records, root_tag="People", record_tag="Person"):
+    with XMLRecordWriter(path, root_tag, record_tag) as writer:
+        writer.write_many(records)
+
+
+# --- Benchmark ---
+def synthetic_people(n):
+    for i in range(n):
+        yield {"Name": f"person_{i}", "Age": 18 + i % 80}
+
+
+def _read_with_parse(path):
+    """The original handle_xml read path."""
+    root = ET.parse(path).getroot()
+    return sum(1 for p in root.findall("Person") if p.find("Name").text)
+
+
+def _read_with_iterparse(path):
+    return sum(1 for record in iter_records(path) if record["Name"])
+
+
+def _timed(fn, path):
+    from csv_streaming import peak_rss_mb
+
+    start = time.perf_counter()
+    count = fn(path)
+    return count, time.perf_counter() - start, peak_rss_mb()
+
+
+def benchmark(sizes=(100_000, 1_000_000), path="people_bench.xml"):
+    """Compare records/sec and peak RSS of ET.parse against iterparse.
+
+    Each reader runs in a fresh worker process so peak RSS is its own.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    print("\n--- Streaming XML Benchmark ---")
+    print(f"{'records':>10} {'reader':>10} {'records/sec':>12} {'peak RSS MB':>12}")
+    try:
+        for n in sizes:
+            write_records(path, synthetic_people(n))
+            for label, fn in (("ET.parse", _read_with_parse), ("iterparse", _read_with_iterparse)):
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    count, elapsed, peak = pool.submit(_timed, fn, path).result()
+                assert count == n, f"expected {n} records, read {count}"
+                print(f"{n:>10,} {label:>10} {n / elapsed:>12,.0f} {peak:>12.1f}")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    benchmark(args.records)
@@ -0,0 +1,229 @@
+"""
+Parallel ZIP Archiver Demo
+Deflates archive members in parallel across a process pool and stitches
+the compressed streams into one standard zip file. Extraction streams only
+the selected members instead of unpacking everything.
+
+Run As : python zip_archiver.py --files 64 --size-mb 4 --level 6
+"""
+
+import fnmatch
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import argparse
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_LEVEL = 6
+
+# Zip record layouts (APPNOTE 4.3.7, 4.3.12, 4.3.16)
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+END_RECORD = struct.Struct("<4s4H2LH")
+ZIP_VERSION = 20  # 2.0, needed for deflate
+UTF8_FLAG = 0x800
+ZIP32_LIMIT = 0xFFFFFFFF
+MAX_MEMBERS = 0xFFFF
+
+
+# --- Compression (runs in worker processes) ---
+def _dos_datetime(timestamp):
+    t = time.localtime(timestamp)
+    year = max(t.tm_year, 1980)
+    date = (year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    clock = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    return date, clock
+
+
+def _deflate_member(path, arcname, level, tmp_dir):
+    """Deflate one file into a temp file and return its zip metadata."""
+    st = os.stat(path)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = size = 0
+    fd, out_path = tempfile.mkstemp(dir=tmp_dir, suffix=".deflate")
+    with open(path, "rb") as src, os.fdopen(fd, "wb") as out:
+        while chunk := src.read(CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            out.write(compressor.compress(chunk))
+        out.write(compressor.flush())
+        compressed_size = out.tell()
+    date, clock = _dos_datetime(st.st_mtime)
+    return {
+        "arcname": arcname,
+        "data_path": out_path,
+        "crc": crc,
+        "file_size": size,
+        "compress_size": compressed_size,
+        "date": date,
+        "time": clock,
+        "mode": st.st_mode,
+    }
+
+
+# --- Stitching ---
+class _Zip64Needed(Exception):
+    """An offset or size does not fit the 32-bit fields of the stitched headers."""
+
+
+def _write_member(out, member):
+    """Write a local header plus compressed data; return the central header."""
+    name = member["arcname"].encode("utf-8")
+    flags = 0 if name.isascii() else UTF8_FLAG
+    offset = out.tell()
+    if max(offset, member["compress_size"], member["file_size"]) >= ZIP32_LIMIT:
+        os.remove(member["data_path"])
+        raise _Zip64Needed
+    out.write(LOCAL_HEADER.pack(
+        b"PK\003\004", ZIP_VERSION, 0, flags, zipfile.ZIP_DEFLATED,
+        member["time"], member["date"], member["crc"],
+        member["compress_size"], member["file_size"], len(name), 0,
+    ))
+    out.write(name)
+    with open(member["data_path"], "rb") as data:
+        shutil.copyfileobj(data, out, CHUNK_SIZE)
+    os.remove(member["data_path"])
+
+    create_system = 0 if sys.platform == "win32" else 3
+    return CENTRAL_HEADER.pack(
+        b"PK\001\002", ZIP_VERSION, create_system, ZIP_VERSION, 0, flags,
+        zipfile.ZIP_DEFLATED, member["time"], member["date"], member["crc"],
+        member["compress_size"], member["file_size"], len(name), 0, 0, 0, 0,
+        (member["mode"] & 0xFFFF) << 16, offset,
+    ) + name
+
+
+def _needs_zip64(paths):
+    """A cheap early answer from input sizes; _write_member re-checks the real offsets."""
+    total = sum(os.path.getsize(p) for p in paths)
+    return len(paths) > MAX_MEMBERS or total >= ZIP32_LIMIT
+
+
+def _write_zip64(archive, paths, arcnames, level):
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+        for path, arcname in zip(paths, arcnames):
+            zf.write(path, arcname)
+
+
+def create_archive(archive, paths, level=DEFAULT_LEVEL, workers=None, arcnames=None):
+    """Create `archive` from `paths`, deflating members on `workers` processes.
+
+    Members are compressed in parallel to temp files, then stitched in input
+    order into one valid zip. Archives needing zip64 (over 4 GiB or 65535
+    members) fall back to the serial zipfile writer. Deflate can grow
+    incompressible data and headers add up, so offsets are checked as they
+    are written, and an archive that overflows them is rewritten that way.
+    """
+    paths = list(paths)
+    # normalized as zipfile does: no drive, no leading slash, "/" separators
+    arcnames = [zipfile.ZipInfo.from_file(path, arcname).filename
+                for path, arcname in zip(paths, arcnames if arcnames is not None else paths)]
+    if not 0 <= level <= 9:
+        raise ValueError("Compression level must be between 0 and 9")
+
+    if _needs_zip64(paths):
+        _write_zip64(archive, paths, arcnames, level)
+        return
+
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(archive)))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool, open(archive, "wb") as out:
+            futures = [
+                pool.submit(_deflate_member, path, arcname, level, tmp_dir)
+                for path, arcname in zip(paths, arcnames)
+            ]
+            central = [_write_member(out, f.result()) for f in futures]
+            cd_offset = out.tell()
+            for header in central:
+                out.write(header)
+            cd_size = out.tell() - cd_offset
+            if cd_offset >= ZIP32_LIMIT or cd_size >= ZIP32_LIMIT:
+                raise _Zip64Needed
+            out.write(END_RECORD.pack(
+                b"PK\005\006", 0, 0, len(central), len(central), cd_size, cd_offset, 0
+            ))
+    except _Zip64Needed:  # the pool has finished, so its temp files are all written
+        _write_zip64(archive, paths, arcnames, level)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# --- Extraction ---
+def _matching(names, patterns):
+    return [n for n in names if any(fnmatch.fnmatch(n, p) for p in patterns)]
+
+
+def extract_members(archive, patterns, dest):
+    """Extract only members matching `patterns`, streaming each to disk."""
+    with zipfile.ZipFile(archive) as zf:
+        names = _matching(zf.namelist(), patterns)
+        for name in names:
+            zf.extract(name, dest)  # sanitizes paths, copies in chunks
+    return names
+
+
+def stream_member(archive, name, chunk_size=CHUNK_SIZE):
+    """Yield the decompressed bytes of one member, `chunk_size` at a time."""
+    with zipfile.ZipFile(archive) as zf, zf.open(name) as member:
+        while chunk := member.read(chunk_size):
+            yield chunk
+
+
+# --- Benchmark ---
+def _make_exports(directory, files, size_mb):
+    paths = []
+    row = "{i},person_{i},{age},London,2024-01-{day:02d}\n"
+    for f in range(files):
+        ext = "json" if f % 2 else "csv"
+        path = os.path.join(directory, f"export_{f:04d}.{ext}")
+        with open(path, "w") as out:
+            i = 0
+            while out.tell() < size_mb * CHUNK_SIZE:
+                out.write("".join(
+                    row.format(i=i + k, age=18 + (i + k) % 80, day=1 + (i + k) % 28)
+                    for k in range(1000)
+                ))
+                i += 1000
+        paths.append(path)
+    return paths
+
+
+def benchmark(files=64, size_mb=4, level=DEFAULT_LEVEL, cores=None):
+    """Report archiving MB/s at 1, 4 and all cores, plus the serial baseline."""
+    cores = cores or sorted({1, 4, os.cpu_count() or 1})
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_exports(tmp, files, size_mb)
+        total_mb = sum(os.path.getsize(p) for p in paths) / CHUNK_SIZE
+        archive = os.path.join(tmp, "bench.zip")
+        print(f"\n--- ZIP Benchmark ({files} files, {total_mb:.0f} MB, level={level}) ---")
+
+        start = time.perf_counter()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+            for path in paths:
+                zf.write(path, os.path.basename(path))
+        print(f"{'serial ZipFile.write':<22} {total_mb / (time.perf_counter() - start):>8.1f} MB/s")
+
+        for n in cores:
+            start = time.perf_counter()
+            create_archive(archive, paths, level, n, map(os.path.basename, paths))
+            elapsed = time.perf_counter() - start
+            with zipfile.ZipFile(archive) as zf:
+                assert zf.testzip() is None
+            print(f"{f'parallel, {n} cores':<22} {total_mb / elapsed:>8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=64)
+    parser.add_argument("--size-mb", type=int, default=4)
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL)
+    parser.add_argument("--cores", type=int, nargs="+")
+    args = parser.parse_args()
+    benchmark(args.files, args.size_mb, args.level, args.cores)